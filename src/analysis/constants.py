@@ -360,6 +360,71 @@ HTML_REPORT_TEMPLATE = """
 </html>
 """
 
+# HTML template for the statistics export (charts are rendered as inline SVG)
+STATISTICS_HTML_TEMPLATE = """
+{%- macro bar_chart(chart) -%}
+<svg width="{{ chart_width }}" height="{{ chart.bars|length * 24 + 10 }}" xmlns="http://www.w3.org/2000/svg">
+    {% for label, value in chart.bars %}
+    <text x="195" y="{{ loop.index0 * 24 + 20 }}" text-anchor="end">{{ label|truncate(30, True)|e }}</text>
+    <rect x="200" y="{{ loop.index0 * 24 + 6 }}" height="18" fill="#3498db"
+          width="{{ (value / chart.max_value * (chart_width - 280)) if chart.max_value else 0 }}"></rect>
+    <text x="{{ 205 + ((value / chart.max_value * (chart_width - 280)) if chart.max_value else 0) }}" y="{{ loop.index0 * 24 + 20 }}">{{ value }}</text>
+    {% endfor %}
+</svg>
+{%- endmacro -%}
+{%- macro line_chart(chart) -%}
+{%- set step = (chart_width - 60) / ((chart.bars|length - 1) if chart.bars|length > 1 else 1) -%}
+<svg width="{{ chart_width }}" height="260" xmlns="http://www.w3.org/2000/svg">
+    <polyline fill="none" stroke="#3498db" stroke-width="2" points="
+        {%- for label, value in chart.bars %}{{ 30 + loop.index0 * step }},{{ 230 - (value / chart.max_value * 200 if chart.max_value else 0) }} {% endfor %}"></polyline>
+    <text x="30" y="250">{{ (chart.bars[0][0] if chart.bars else '')|e }}</text>
+    <text x="{{ chart_width - 30 }}" y="250" text-anchor="end">{{ (chart.bars[-1][0] if chart.bars else '')|e }}</text>
+    <text x="30" y="20">max {{ chart.max_value }}</text>
+</svg>
+{%- endmacro -%}
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Data Statistics Report</title>
+    <style>
+        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 0; padding: 20px; background-color: #f8f9fa; }
+        .container { max-width: 1100px; margin: 0 auto; background-color: white; padding: 30px; border-radius: 15px; }
+        h1 { color: #2c3e50; text-align: center; border-bottom: 4px solid #3498db; padding-bottom: 15px; }
+        h2 { color: #34495e; border-left: 4px solid #3498db; padding-left: 15px; }
+        table { border-collapse: collapse; width: 100%; margin: 15px 0; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #3498db; color: white; }
+        svg text { font-size: 12px; fill: #2c3e50; }
+        .timestamp { text-align: center; color: #7f8c8d; margin-top: 30px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>📊 Data Statistics Report</h1>
+
+        {% for section, values in sections.items() %}
+        <h2>{{ section|replace('_', ' ')|title }}</h2>
+        <table>
+            <tr><th>Dimension</th><th>Key</th><th>Value</th></tr>
+            {% for dimension, key, value in values %}
+            <tr><td>{{ dimension|e }}</td><td>{{ key|e }}</td><td>{{ value|e }}</td></tr>
+            {% endfor %}
+        </table>
+        {% endfor %}
+
+        {% for chart in charts %}
+        <h2>{{ chart.title }}</h2>
+        {{ line_chart(chart) if chart.kind == 'line' else bar_chart(chart) }}
+        {% endfor %}
+
+        <div class="timestamp">Generated at {{ generated_at }}</div>
+    </div>
+</body>
+</html>
+"""
+
 # Image file patterns to look for in reports directory
 VISUALIZATION_IMAGES = {
     'temporal_distribution': 'temporal_distribution.png',
@@ -8,12 +8,11 @@ import numpy as np
 import sqlite3
 import json
 import base64
+import functools
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 import os
 from pathlib import Path
-import matplotlib.pyplot as plt
-import seaborn as sns
 from collections import Counter
 import re
 import openpyxl
@@ -30,6 +29,12 @@ from src.analysis.trends import TrendAnalysis
 from src.analysis.constants import HTML_REPORT_TEMPLATE, VISUALIZATION_IMAGES, ALERT_STYLES, REPORT_SETTINGS
 
 
+@functools.lru_cache(maxsize=None)
+def _html_report_template() -> jinja2.Template:
+    """Compile the HTML report template once per process."""
+    return jinja2.Template(HTML_REPORT_TEMPLATE)
+
+
 class ReportGenerator:
     """Generate comprehensive reports with insights and data export."""
     
@@ -463,8 +468,7 @@ class ReportGenerator:
         }
         
         # Render template
-        template = jinja2.Template(HTML_REPORT_TEMPLATE)
-        html_content = template.render(**template_data)
+        html_content = _html_report_template().render(**template_data)
         
         # Write to file
         with open(output_path, 'w', encoding='utf-8') as f:
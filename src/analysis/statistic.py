@@ -11,10 +11,18 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 import os
 from pathlib import Path
-import matplotlib.pyplot as plt
-import seaborn as sns
 from collections import Counter
 import re
+import functools
+import jinja2
+
+from src.analysis.constants import STATISTICS_HTML_TEMPLATE, REPORT_SETTINGS
+
+
+@functools.lru_cache(maxsize=None)
+def _statistics_html_template() -> jinja2.Template:
+    """Compile the statistics HTML template once per process."""
+    return jinja2.Template(STATISTICS_HTML_TEMPLATE)
 
 
 class DataStatistics:
@@ -27,9 +35,11 @@ class DataStatistics:
         self.db_path = db_path
         self.df = None
         self.connection = None
+        self._length_cache = {}
         
     def load_data(self) -> bool:
         """Load data from CSV or database."""
+        self._length_cache = {}
         try:
             if os.path.exists(self.data_path):
                 self.df = pd.read_csv(self.data_path)
@@ -47,6 +57,12 @@ class DataStatistics:
             print(f"Error loading data: {e}")
             return False
     
+    def _text_lengths(self, column: str) -> pd.Series:
+        """String lengths of a text column, computed once per load and shared by every report."""
+        if column not in self._length_cache:
+            self._length_cache[column] = self.df[column].str.len()
+        return self._length_cache[column]
+    
     def close_connection(self):
         """Close database connection."""
         if self.connection:
@@ -98,7 +114,7 @@ class DataStatistics:
         
         # Check for anomalies in text lengths
         if 'title' in self.df.columns:
-            title_lengths = self.df['title'].str.len()
+            title_lengths = self._text_lengths('title')
             quality_report["anomalies"]["title_length"] = {
                 "min": int(title_lengths.min()),
                 "max": int(title_lengths.max()),
@@ -107,7 +123,7 @@ class DataStatistics:
             }
         
         if 'summary' in self.df.columns:
-            summary_lengths = self.df['summary'].str.len()
+            summary_lengths = self._text_lengths('summary')
             quality_report["anomalies"]["summary_length"] = {
                 "min": int(summary_lengths.min()),
                 "max": int(summary_lengths.max()),
@@ -164,7 +180,7 @@ class DataStatistics:
         
         # Content analysis
         if 'title' in self.df.columns:
-            title_lengths = self.df['title'].str.len()
+            title_lengths = self._text_lengths('title')
             summary["content_analysis"]["title_stats"] = {
                 "avg_length": float(title_lengths.mean()),
                 "median_length": float(title_lengths.median()),
@@ -172,7 +188,7 @@ class DataStatistics:
             }
         
         if 'summary' in self.df.columns:
-            summary_lengths = self.df['summary'].str.len()
+            summary_lengths = self._text_lengths('summary')
             summary["content_analysis"]["summary_stats"] = {
                 "avg_length": float(summary_lengths.mean()),
                 "median_length": float(summary_lengths.median()),
@@ -217,7 +233,7 @@ class DataStatistics:
         
         # Content length distribution
         if 'title' in self.df.columns:
-            title_lengths = self.df['title'].str.len()
+            title_lengths = self._text_lengths('title')
             distributions["content_length_distribution"]["title"] = {
                 "percentiles": {
                     "25%": float(title_lengths.quantile(0.25)),
@@ -234,7 +250,7 @@ class DataStatistics:
             }
         
         if 'summary' in self.df.columns:
-            summary_lengths = self.df['summary'].str.len()
+            summary_lengths = self._text_lengths('summary')
             distributions["content_length_distribution"]["summary"] = {
                 "percentiles": {
                     "25%": float(summary_lengths.quantile(0.25)),
@@ -272,6 +288,10 @@ class DataStatistics:
             print("No data loaded for visualization")
             return
         
+        # Plotting libraries are only needed for PNG output, so import them lazily
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
         
@@ -302,7 +322,7 @@ class DataStatistics:
         # 3. Title length distribution
         if 'title' in self.df.columns:
             plt.figure(figsize=(10, 6))
-            title_lengths = self.df['title'].str.len()
+            title_lengths = self._text_lengths('title')
             plt.hist(title_lengths, bins=50, alpha=0.7, edgecolor='black')
             plt.xlabel('Title Length (characters)')
             plt.ylabel('Frequency')
@@ -343,8 +363,60 @@ class DataStatistics:
         
         print(f"Visualizations saved to {output_dir}")
     
+    def _flatten_statistics(self, stats: Dict[str, Any], path: Tuple[str, ...] = ()) -> List[Tuple]:
+        """Flatten nested statistics into long-format (metric, dimension, key, value, text) rows.
+
+        Numeric leaves go into ``value``; everything else is stored as a string in ``text``.
+        """
+        rows = []
+        for k, v in stats.items():
+            key_path = path + (str(k),)
+            if isinstance(v, dict):
+                rows.extend(self._flatten_statistics(v, key_path))
+                continue
+            
+            metric, dimension, key = key_path[0], '.'.join(key_path[1:-1]), key_path[-1]
+            if isinstance(v, (int, float, np.number)) and not isinstance(v, (bool, np.bool_)):
+                rows.append((metric, dimension, key, float(v), None))
+            else:
+                rows.append((metric, dimension, key, None, None if v is None else str(v)))
+        return rows
+    
+    def _chart_data(self) -> List[Dict[str, Any]]:
+        """Collect the series plotted in the HTML statistics report."""
+        charts = []
+        
+        def add_chart(title, series, kind='bar'):
+            bars = [(str(k), int(v)) for k, v in series.items()]
+            if bars:
+                charts.append({
+                    "title": title,
+                    "kind": kind,
+                    "bars": bars,
+                    "max_value": max(v for _, v in bars)
+                })
+        
+        add_chart('Top 15 Sources by Article Count', self.df['source'].value_counts().head(15))
+        add_chart('Distribution by Source Type', self.df['source_type'].value_counts())
+        
+        if 'title' in self.df.columns:
+            title_lengths = self._text_lengths('title').dropna()
+            if len(title_lengths) > 0:
+                counts, edges = np.histogram(title_lengths, bins=10)
+                add_chart('Distribution of Title Lengths',
+                          {f"{edges[i]:.0f}-{edges[i + 1]:.0f}": counts[i] for i in range(len(counts))})
+        
+        if 'pub_date' in self.df.columns and pd.api.types.is_datetime64_any_dtype(self.df['pub_date']):
+            daily_counts = self.df['pub_date'].dt.date.value_counts().sort_index()
+            add_chart('Articles Published Over Time', daily_counts, kind='line')
+        
+        if 'author' in self.df.columns:
+            add_chart('Top 20 Authors by Article Count', self.df['author'].value_counts().head(20))
+        
+        return charts
+    
     def export_statistics(self, output_dir: str = "data_output/reports") -> Dict[str, str]:
-        """Export all statistics to files."""
+        """Export all statistics to one Parquet table and one self-contained HTML report."""
         os.makedirs(output_dir, exist_ok=True)
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -357,35 +429,35 @@ class DataStatistics:
         
         # Combine all statistics
         all_stats = {
-            "generated_at": datetime.now().isoformat(),
             "data_quality": quality_report,
             "statistical_summary": statistical_summary,
             "distributions": distributions
         }
-        
-        # Export to JSON
-        json_path = f"{output_dir}/statistics_{timestamp}.json"
-        with open(json_path, 'w') as f:
-            json.dump(all_stats, f, indent=2, default=str)
-        exported_files["json"] = json_path
-        
-        # Export to CSV (summary statistics)
-        csv_data = []
-        for source, count in statistical_summary.get("source_analysis", {}).get("top_sources", {}).items():
-            csv_data.append({
-                "source": source,
-                "article_count": count,
-                "percentage": count / statistical_summary["basic_stats"]["total_articles"] * 100
-            })
-        
-        if csv_data:
-            df_summary = pd.DataFrame(csv_data)
-            csv_path = f"{output_dir}/source_statistics_{timestamp}.csv"
-            df_summary.to_csv(csv_path, index=False)
-            exported_files["csv"] = csv_path
-        
-        # Generate visualizations
-        self.generate_visualizations(output_dir)
+        generated_at = datetime.now().isoformat()
+        
+        # Export aggregates to Parquet in long format
+        rows = self._flatten_statistics(all_stats)
+        stats_df = pd.DataFrame(rows, columns=['metric', 'dimension', 'key', 'value', 'text'])
+        parquet_path = f"{output_dir}/statistics_{timestamp}.parquet"
+        stats_df.to_parquet(parquet_path, compression='zstd', index=False)
+        exported_files["parquet"] = parquet_path
+        
+        # Export HTML report with inline SVG charts
+        sections = {}
+        for metric, dimension, key, value, text in rows:
+            display = f"{value:g}" if value is not None else (text if text is not None else "")
+            sections.setdefault(metric, []).append((dimension, key, display))
+        
+        html_content = _statistics_html_template().render(
+            generated_at=generated_at,
+            sections=sections,
+            charts=self._chart_data(),
+            chart_width=REPORT_SETTINGS['chart_width']
+        )
+        html_path = f"{output_dir}/statistics_{timestamp}.html"
+        with open(html_path, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        exported_files["html"] = html_path
         
         return exported_files
 
@@ -5,19 +5,49 @@ Provides time-based trend analysis and comparative analysis across sources.
 
 import pandas as pd
 import numpy as np
+import functools
 import sqlite3
 import json
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 import os
 from pathlib import Path
-import matplotlib.pyplot as plt
-import seaborn as sns
-from collections import Counter
 import re
 from scipy import stats
 from sklearn.preprocessing import StandardScaler
 from sklearn.decomposition import PCA
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.data.models import parse_datetime
+from src.utils import jsonio
+
+
+@functools.lru_cache(maxsize=None)
+def _pyplot():
+    """Import and style pyplot on first use, keeping matplotlib off the import path."""
+    # Trend charts are only ever written to files: render headless, style once
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    plt.style.use('seaborn-v0_8')
+    sns.set_palette("husl")
+    return plt
+
+
+# Daily series longer than this are drawn without point markers
+DAILY_MARKER_LIMIT = 500
+
+# PNG files written by generate_trend_visualizations
+TREND_CHARTS = ['daily_trend.png', 'monthly_trend.png', 'source_type_trends.png',
+                'seasonal_patterns.png', 'source_performance.png']
+
+# Meteorological seasons in calendar order, indexed by (month % 12) // 3
+SEASONS = ['Winter', 'Spring', 'Summer', 'Fall']
+
+# Characters Arrow's RE2 engine counts as \w; its \b only sees word edges next to these
+ASCII_WORD_CHAR = re.compile(r'[0-9a-z_]')
 
 
 def custom_json_encoder(obj):
@@ -38,9 +68,47 @@ def custom_json_encoder(obj):
         return str(obj)
 
 
+def _memoize_analysis(method):
+    """Cache an analysis result on the instance until the data is reloaded."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        freeze = lambda value: tuple(value) if isinstance(value, list) else value
+        key = (method.__name__,
+               tuple(freeze(arg) for arg in args),
+               tuple(sorted((name, freeze(value)) for name, value in kwargs.items())))
+        if key not in self._cache:
+            self._cache[key] = method(self, *args, **kwargs)
+        return self._cache[key]
+    return wrapper
+
+
 class TrendAnalysis:
     """Trend analysis for scraped data."""
     
+    # Columns read by the analysis methods; Parquet loads skip everything else
+    ANALYSIS_COLUMNS = ['title', 'summary', 'source', 'source_type', 'publication_date_datetime']
+    TEXT_COLUMNS = ['title', 'summary']
+    CATEGORY_COLUMNS = ['source', 'source_type']
+    DB_CHUNK_SIZE = 100_000
+    
+    # Per (source, source_type, day) aggregates computed inside SQLite; the
+    # column names match aggregate_cube so the analyses can run off either
+    AGGREGATE_QUERY = """
+        SELECT source, source_type,
+               substr(publication_date_datetime, 1, 10) AS pub_day,
+               COUNT(*) AS n,
+               COUNT(title) AS title_count,
+               MIN(publication_date_datetime) AS first_article,
+               MAX(publication_date_datetime) AS last_article,
+               SUM(LENGTH(title)) AS title_len,
+               COUNT(title) AS title_len_n,
+               SUM(LENGTH(summary)) AS summary_len,
+               COUNT(summary) AS summary_len_n
+        FROM articles
+        WHERE julianday(publication_date_datetime) IS NOT NULL
+        GROUP BY 1, 2, 3
+    """
+    
     def __init__(self, data_path: str = "data_output/combined.csv", 
                  db_path: str = "data_output/scraped_articles.db"):
         """Initialize with data paths."""
@@ -48,36 +116,306 @@ class TrendAnalysis:
         self.db_path = db_path
         self.df = None
         self.connection = None
+        # Derived aggregates and analysis results for the currently loaded data
+        self._cache: Dict[Any, Any] = {}
+        # File the current data was loaded from; charts are compared against it
+        self._source_path: Optional[str] = None
         
     def load_data(self) -> bool:
-        """Load data from CSV or database."""
+        """Load data from the Parquet cache, CSV or database."""
+        self._cache.clear()
+        self._source_path = None
         try:
-            if os.path.exists(self.data_path):
+            parquet_path = f"{self.data_path}.parquet"
+            if self._parquet_cache_is_fresh(parquet_path):
+                # The cache mirrors the CSV when there is one
+                self._source_path = self.data_path if os.path.exists(self.data_path) else parquet_path
+                available = pq.read_schema(parquet_path).names
+                columns = [col for col in self.ANALYSIS_COLUMNS if col in available]
+                self.df = pq.read_table(parquet_path, columns=columns).to_pandas()
+                print(f"Loaded {len(self.df)} records from Parquet cache")
+            elif os.path.exists(self.data_path):
                 self.df = pd.read_csv(self.data_path)
+                self._source_path = self.data_path
                 print(f"Loaded {len(self.df)} records from CSV")
+                self._write_parquet_cache(parquet_path)
             elif os.path.exists(self.db_path):
                 self.connection = sqlite3.connect(self.db_path)
-                self.df = pd.read_sql_query("SELECT * FROM articles", self.connection)
+                self.df = self._read_articles_from_db()
+                self._source_path = self.db_path
                 print(f"Loaded {len(self.df)} records from database")
             else:
                 print("No data files found")
                 return False
             
+            # Arrow-backed strings run .str kernels (length, lower, regex) in C++
+            # rather than one Python call per row
+            for col in self.TEXT_COLUMNS:
+                if col in self.df.columns:
+                    self.df[col] = self.df[col].astype('string[pyarrow]')
+            # Low-cardinality keys group on small integer codes instead of hashed strings
+            for col in self.CATEGORY_COLUMNS:
+                if col in self.df.columns:
+                    self.df[col] = self.df[col].astype('category')
+            
             # Preprocess dates
             if 'publication_date_datetime' in self.df.columns:
-                self.df['pub_date'] = pd.to_datetime(self.df['publication_date_datetime'], errors='coerce')
+                # Scraped feeds repeat the same timestamps, so parse each distinct string once
+                codes, uniques = pd.factorize(self.df['publication_date_datetime'])
+                parsed = self._parse_timestamps(uniques)
+                self.df['pub_date'] = parsed.take(codes, allow_fill=True, fill_value=pd.NaT)
                 self.df = self.df.dropna(subset=['pub_date'])
+                
+                # Day and month buckets as plain datetime64 columns, so grouping
+                # never builds a Python date object per row
+                wall_clock = self._wall_clock(self.df['pub_date'])
+                self.df['pub_day'] = wall_clock.astype('datetime64[D]')
+                self.df['pub_month'] = wall_clock.astype('datetime64[M]')
             
             return True
         except Exception as e:
             print(f"Error loading data: {e}")
             return False
     
+    def _read_articles_from_db(self) -> pd.DataFrame:
+        """Read the analysis columns from SQLite in chunks, assembled as Arrow batches.
+        
+        Each chunk is transposed straight into Arrow string arrays, so no
+        intermediate pandas object frame is built.
+        """
+        available = {row[1] for row in self.connection.execute("PRAGMA table_info(articles)")}
+        columns = [col for col in self.ANALYSIS_COLUMNS if col in available]
+        schema = pa.schema([(col, pa.string()) for col in columns])
+        
+        cursor = self.connection.execute(f"SELECT {', '.join(columns)} FROM articles")
+        batches = []
+        while True:
+            rows = cursor.fetchmany(self.DB_CHUNK_SIZE)
+            if not rows:
+                break
+            arrays = [pa.array(values, type=pa.string()) for values in zip(*rows)]
+            batches.append(pa.RecordBatch.from_arrays(arrays, schema=schema))
+        
+        table = pa.Table.from_batches(batches, schema=schema)
+        return table.to_pandas(types_mapper={pa.string(): pd.StringDtype('pyarrow')}.get)
+    
+    def load_aggregates_from_db(self) -> bool:
+        """Load only per (source, source_type, day) aggregates from the database.
+        
+        Counting and length sums run inside SQLite, so only the small aggregate
+        frame is transferred. Temporal, source and source type analyses and the
+        visualizations run off it; keyword analysis needs article text and finds
+        nothing in this mode.
+        """
+        if not os.path.exists(self.db_path):
+            print("No database found")
+            return False
+        
+        self._cache.clear()
+        self._source_path = self.db_path
+        try:
+            self.connection = sqlite3.connect(self.db_path)
+            chunks = pd.read_sql_query(self.AGGREGATE_QUERY, self.connection, chunksize=100_000)
+            aggregates = pd.concat(chunks, ignore_index=True)
+            
+            aggregates['pub_day'] = pd.to_datetime(aggregates['pub_day'], format='%Y-%m-%d', errors='coerce')
+            # Same parsing as load_data, so both modes keep the same rows
+            for col in ('first_article', 'last_article'):
+                aggregates[col] = self._parse_timestamps(aggregates[col])
+            aggregates = aggregates.dropna(subset=['pub_day', 'first_article'])
+            for col in ('title_len', 'summary_len'):
+                aggregates[col] = aggregates[col].fillna(0).astype(np.int64)
+            
+            cube = aggregates.set_index(['source', 'source_type', 'pub_day'])
+            self._cache['aggregate_cube'] = self._downcast_cube(cube)
+            # An empty frame keeps the column checks in the analysis methods working
+            self.df = pd.DataFrame(columns=self.ANALYSIS_COLUMNS + ['pub_date', 'pub_day', 'pub_month'])
+            print(f"Loaded {len(aggregates)} aggregate rows from database")
+            return True
+        except Exception as e:
+            print(f"Error loading aggregates: {e}")
+            return False
+    
+    def _parquet_cache_is_fresh(self, parquet_path: str) -> bool:
+        """Check that the Parquet cache exists and is not older than the CSV it mirrors."""
+        if not os.path.exists(parquet_path):
+            return False
+        if not os.path.exists(self.data_path):
+            return True
+        return os.path.getmtime(parquet_path) >= os.path.getmtime(self.data_path)
+    
+    def _write_parquet_cache(self, parquet_path: str):
+        """Persist the freshly parsed CSV as Parquet so later loads skip CSV parsing."""
+        try:
+            self.df.to_parquet(parquet_path, compression='zstd', index=False)
+        except Exception as e:
+            print(f"Could not write Parquet cache: {e}")
+    
+    @staticmethod
+    def _parse_timestamps(values) -> pd.Index:
+        """Parse ISO 8601 strings one by one, each keeping its own UTC offset.
+        
+        Unparseable values become NaT. A mix of offsets (or of naive and
+        offset-aware values) gives an object index of Timestamps.
+        """
+        return pd.Index([pd.Timestamp(ts) if ts is not None else pd.NaT
+                         for ts in map(parse_datetime, values)])
+    
+    @staticmethod
+    def _wall_clock(pub_date: pd.Series) -> np.ndarray:
+        """Return publication times as naive datetime64 values in each feed's local time."""
+        if isinstance(pub_date.dtype, pd.DatetimeTZDtype):
+            pub_date = pub_date.dt.tz_localize(None)
+        elif not pd.api.types.is_datetime64_any_dtype(pub_date):
+            # Mixed UTC offsets leave an object column of Timestamps
+            pub_date = pd.to_datetime(pub_date.map(lambda ts: ts.replace(tzinfo=None)))
+        return pub_date.values
+    
+    @staticmethod
+    def _count_by_month(months: np.ndarray) -> pd.Series:
+        """Count ``pub_month`` values per month, indexed by monthly period."""
+        counts = pd.Index(months).value_counts(sort=False).sort_index()
+        counts.index = counts.index.to_period('M')
+        return counts
+    
+    @property
+    def aggregate_cube(self) -> pd.DataFrame:
+        """Per (source, source_type, day) aggregates shared by every report section.
+        
+        Built in a single groupby per load; the analysis methods marginalize it
+        instead of re-scanning ``self.df``.
+        """
+        if 'aggregate_cube' not in self._cache:
+            # Columns are collected into a fresh frame; self.df itself is never modified
+            keys = ['source', 'source_type']
+            work = {key: self.df[key] for key in keys}
+            work['title_count'] = self.df['title'].notna()
+            aggregations = {
+                'n': ('title_count', 'size'),
+                'title_count': ('title_count', 'sum'),
+            }
+            if 'pub_date' in self.df.columns:
+                keys.append('pub_day')
+                work['pub_day'] = self.df['pub_day']
+                work['pub_date'] = self.df['pub_date']
+                aggregations['first_article'] = ('pub_date', 'min')
+                aggregations['last_article'] = ('pub_date', 'max')
+            for field in ('title', 'summary'):
+                if field in self.df.columns:
+                    lengths = self.df[field].str.len()
+                    work[f'{field}_len'] = lengths.to_numpy(dtype=np.int32, na_value=0)
+                    work[f'{field}_len_n'] = lengths.notna().to_numpy()
+                    aggregations[f'{field}_len'] = (f'{field}_len', 'sum')
+                    aggregations[f'{field}_len_n'] = (f'{field}_len_n', 'sum')
+            # sort=False keeps groups in first-appearance order
+            cube = pd.DataFrame(work).groupby(keys, observed=True, sort=False, dropna=False).agg(**aggregations)
+            self._cache['aggregate_cube'] = self._downcast_cube(cube)
+        return self._cache['aggregate_cube']
+    
+    @staticmethod
+    def _downcast_cube(cube: pd.DataFrame) -> pd.DataFrame:
+        """Store per-cell article counts as int32; a single cell never nears 2**31 rows.
+        
+        Length sums stay int64 so the mean lengths derived from them are exact.
+        """
+        dtypes = {'n': np.int32, 'title_count': np.int32,
+                  'title_len': np.int64, 'title_len_n': np.int32,
+                  'summary_len': np.int64, 'summary_len_n': np.int32}
+        return cube.astype({col: dtype for col, dtype in dtypes.items() if col in cube.columns})
+    
+    def _daily_by(self, level: str) -> pd.Series:
+        """Articles per (level, day), sorted by level then day."""
+        return self.aggregate_cube['n'].groupby(level=[level, 'pub_day'], observed=True).sum()
+    
+    def _daily_matrix(self, level: str) -> Tuple[pd.Index, pd.DatetimeIndex, np.ndarray]:
+        """Dense (group x day) article counts for a cube level, built with one bincount.
+        
+        Rows follow the sorted non-null group values, columns the sorted days.
+        """
+        cube = self.aggregate_cube
+        group_codes, groups = pd.factorize(cube.index.get_level_values(level), sort=True)
+        day_codes, days = pd.factorize(cube.index.get_level_values('pub_day'), sort=True)
+        observed = group_codes >= 0
+        flat_keys = group_codes[observed].astype(np.int64) * len(days) + day_codes[observed]
+        counts = np.bincount(flat_keys, weights=cube['n'].to_numpy()[observed],
+                             minlength=len(groups) * len(days))
+        return pd.Index(groups), pd.DatetimeIndex(days), counts.reshape(len(groups), len(days))
+    
+    def _daily_stats(self, level: str) -> pd.DataFrame:
+        """Per-group daily statistics over the days each group was active.
+        
+        Total articles, active days, mean and sample std (ddof=1) of daily
+        counts, and the first day with the peak count, all as row-wise
+        reductions over the dense daily matrix.
+        """
+        columns = ['total', 'n_days', 'mean', 'std', 'peak_day']
+        groups, days, counts = self._daily_matrix(level)
+        if counts.size == 0:
+            return pd.DataFrame(columns=columns)
+        
+        active = counts > 0
+        n_days = active.sum(axis=1)
+        totals = counts.sum(axis=1)
+        mean = totals / n_days
+        deviations = np.where(active, counts - mean[:, None], 0.0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            std = np.sqrt((deviations ** 2).sum(axis=1) / (n_days - 1))
+        
+        return pd.DataFrame({
+            'total': totals.astype('int64'),
+            'n_days': n_days,
+            'mean': mean,
+            'std': std,
+            'peak_day': days[counts.argmax(axis=1)].date
+        }, index=groups, columns=columns)
+    
+    def _appearance_order(self, level: str) -> List[Any]:
+        """Non-null values of a cube level in the order they first appear in the data."""
+        return self.aggregate_cube.index.get_level_values(level).unique().dropna().tolist()
+    
+    def _value_counts(self, level: str) -> pd.Series:
+        """Equivalent of ``self.df[level].value_counts()`` computed from the cube."""
+        counts = self.aggregate_cube['n'].groupby(level=level, observed=True, sort=False).sum()
+        return counts.sort_values(ascending=False, kind='stable')
+    
+    def _mean_length(self, field: str, level: str) -> pd.Series:
+        """Mean string length of a text field per value of a cube level."""
+        totals = self.aggregate_cube[[f'{field}_len', f'{field}_len_n']].groupby(level=level, observed=True).sum()
+        return totals[f'{field}_len'] / totals[f'{field}_len_n']
+    
+    @staticmethod
+    def _as_dates(daily_counts: pd.Series) -> pd.Series:
+        """Re-index a per-day series by ``datetime.date`` for reporting."""
+        return pd.Series(daily_counts.values, index=pd.Index(daily_counts.index.date))
+    
+    @staticmethod
+    def _by_month(daily_counts: pd.Series) -> pd.Series:
+        """Roll a per-day series (datetime index) up to monthly periods."""
+        return daily_counts.groupby(daily_counts.index.to_period('M')).sum()
+    
+    @staticmethod
+    def _by_season(daily_counts: pd.Series) -> pd.Series:
+        """Roll a per-day series (datetime index) up to meteorological seasons."""
+        # (month % 12) // 3 maps Dec-Feb to 0, Mar-May to 1, Jun-Aug to 2, Sep-Nov to 3
+        season_codes = (daily_counts.index.month.values % 12) // 3
+        seasons = pd.Categorical.from_codes(season_codes.astype(np.int8), categories=SEASONS)
+        return daily_counts.groupby(seasons, observed=True).sum()
+    
+    @property
+    def daily_counts(self) -> pd.Series:
+        """Articles per day over the whole dataset, indexed by date."""
+        return self._as_dates(self._daily_totals())
+    
+    def _daily_totals(self) -> pd.Series:
+        """Articles per day over the whole dataset, indexed by day timestamp."""
+        return self.aggregate_cube['n'].groupby(level='pub_day').sum()
+    
     def close_connection(self):
         """Close database connection."""
         if self.connection:
             self.connection.close()
     
+    @_memoize_analysis
     def temporal_trend_analysis(self) -> Dict[str, Any]:
         """Analyze temporal trends in the data."""
         if self.df is None or 'pub_date' not in self.df.columns:
@@ -92,7 +430,8 @@ class TrendAnalysis:
         }
         
         # Daily trends
-        daily_counts = self.df.groupby(self.df['pub_date'].dt.date).size()
+        daily_totals = self._daily_totals()
+        daily_counts = self._as_dates(daily_totals)
         trends["daily_trends"] = {
             "total_days": len(daily_counts),
             "avg_articles_per_day": float(daily_counts.mean()),
@@ -105,21 +444,22 @@ class TrendAnalysis:
         }
         
         # Weekly trends
-        self.df['week'] = self.df['pub_date'].dt.isocalendar().week
-        self.df['year'] = self.df['pub_date'].dt.year
-        weekly_counts = self.df.groupby(['year', 'week']).size()
+        # ISO weeks as integer buckets: epoch day 0 is a Thursday, so (day + 3) // 7
+        # rolls over every Monday and each bucket is labelled by its Thursday
+        epoch_days = daily_totals.index.values.astype('datetime64[D]').astype('int64')
+        weekly_counts = daily_totals.groupby((epoch_days + 3) // 7).sum()
+        peak_year, peak_week, _ = pd.Timestamp(int(weekly_counts.idxmax()) * 7, unit='D').isocalendar()
         
         trends["weekly_trends"] = {
             "total_weeks": len(weekly_counts),
             "avg_articles_per_week": float(weekly_counts.mean()),
-            "peak_week": f"{weekly_counts.idxmax()[0]}-W{weekly_counts.idxmax()[1]:02d}",
+            "peak_week": f"{peak_year}-W{peak_week:02d}",
             "peak_count": int(weekly_counts.max()),
             "variance": float(weekly_counts.var())
         }
         
         # Monthly trends
-        self.df['month'] = self.df['pub_date'].dt.to_period('M')
-        monthly_counts = self.df.groupby('month').size()
+        monthly_counts = self._by_month(daily_totals)
         
         trends["monthly_trends"] = {
             "total_months": len(monthly_counts),
@@ -130,14 +470,7 @@ class TrendAnalysis:
         }
         
         # Seasonal patterns
-        self.df['season'] = self.df['pub_date'].dt.month.map({
-            12: 'Winter', 1: 'Winter', 2: 'Winter',
-            3: 'Spring', 4: 'Spring', 5: 'Spring',
-            6: 'Summer', 7: 'Summer', 8: 'Summer',
-            9: 'Fall', 10: 'Fall', 11: 'Fall'
-        })
-        
-        seasonal_counts = self.df.groupby('season').size()
+        seasonal_counts = self._by_season(daily_totals)
         trends["seasonal_patterns"] = seasonal_counts.to_dict()
         
         # Growth rates
@@ -152,6 +485,7 @@ class TrendAnalysis:
         
         return trends
     
+    @_memoize_analysis
     def source_comparative_analysis(self) -> Dict[str, Any]:
         """Compare trends across different sources."""
         if self.df is None:
@@ -165,12 +499,12 @@ class TrendAnalysis:
         }
         
         # Source performance metrics
-        source_stats = self.df.groupby('source').agg({
-            'title': 'count',
-            'pub_date': ['min', 'max']
-        }).round(2)
+        source_stats = self.aggregate_cube.groupby(level='source', observed=True).agg(
+            article_count=('title_count', 'sum'),
+            first_article=('first_article', 'min'),
+            last_article=('last_article', 'max')
+        )
         
-        source_stats.columns = ['article_count', 'first_article', 'last_article']
         source_stats['date_range_days'] = (source_stats['last_article'] - source_stats['first_article']).dt.days
         source_stats['articles_per_day'] = source_stats['article_count'] / source_stats['date_range_days']
         
@@ -178,33 +512,49 @@ class TrendAnalysis:
         top_sources = source_stats.nlargest(10, 'article_count')
         comparison["source_performance"]["top_sources"] = top_sources.to_dict('index')
         
+        # Correlation of daily publication counts between the top sources
+        if 'pub_date' in self.df.columns and len(top_sources) > 1:
+            top_sources_list = top_sources.index.tolist()
+            daily_matrix = (self._daily_by('source')
+                            .loc[top_sources_list]
+                            .unstack(level='source', fill_value=0)
+                            .reindex(columns=top_sources_list))
+            corr = daily_matrix.corr().to_numpy()
+            upper_i, upper_j = np.triu_indices(len(top_sources_list), k=1)
+            comparison["correlation_analysis"]["daily_count_correlation"] = {
+                f"{top_sources_list[i]} vs {top_sources_list[j]}": float(corr[i, j])
+                for i, j in zip(upper_i, upper_j)
+                if not np.isnan(corr[i, j])
+            }
+        
         # Content comparison
         if 'title' in self.df.columns:
-            title_lengths_by_source = self.df.groupby('source')['title'].apply(lambda x: x.str.len().mean())
+            title_lengths_by_source = self._mean_length('title', 'source')
             comparison["content_comparison"]["avg_title_length"] = title_lengths_by_source.to_dict()
         
         if 'summary' in self.df.columns:
-            summary_lengths_by_source = self.df.groupby('source')['summary'].apply(lambda x: x.str.len().mean())
+            summary_lengths_by_source = self._mean_length('summary', 'source')
             comparison["content_comparison"]["avg_summary_length"] = summary_lengths_by_source.to_dict()
         
         # Temporal comparison by source
         if 'pub_date' in self.df.columns:
             source_temporal = {}
-            for source in self.df['source'].unique():
-                source_data = self.df[self.df['source'] == source]
-                if len(source_data) > 10:  # Only analyze sources with sufficient data
-                    daily_counts = source_data.groupby(source_data['pub_date'].dt.date).size()
+            daily_stats = self._daily_stats('source')
+            for source in self._appearance_order('source'):
+                row = daily_stats.loc[source]
+                if row['total'] > 10:  # Only analyze sources with sufficient data
                     source_temporal[source] = {
-                        "avg_daily_articles": float(daily_counts.mean()),
-                        "peak_day": str(daily_counts.idxmax()) if len(daily_counts) > 0 else None,
-                        "total_days_active": len(daily_counts),
-                        "consistency_score": float(1 - daily_counts.std() / daily_counts.mean()) if daily_counts.mean() > 0 else 0
+                        "avg_daily_articles": float(row['mean']),
+                        "peak_day": str(row['peak_day']),
+                        "total_days_active": int(row['n_days']),
+                        "consistency_score": float(1 - row['std'] / row['mean']) if row['mean'] > 0 else 0
                     }
             
             comparison["temporal_comparison"] = source_temporal
         
         return comparison
     
+    @_memoize_analysis
     def keyword_trend_analysis(self, keywords: Optional[List[str]] = None) -> Dict[str, Any]:
         """Analyze trends for specific keywords."""
         if self.df is None or 'pub_date' not in self.df.columns:
@@ -216,16 +566,17 @@ class TrendAnalysis:
         
         keyword_trends = {}
         
+        # Lower-case each text column once; _keyword_mask narrows each keyword's
+        # rows with a C-level scan before the Python regex check
+        texts = [self.df[col].str.lower() for col in self.TEXT_COLUMNS if col in self.df.columns]
+        months = self.df['pub_month'].to_numpy()
+        
         for keyword in keywords:
             # Find articles containing the keyword
-            keyword_articles = self.df[
-                self.df['title'].str.contains(keyword, case=False, na=False) |
-                self.df['summary'].str.contains(keyword, case=False, na=False)
-            ].copy()
+            keyword_articles = months[self._keyword_mask(texts, keyword)]
             
             if len(keyword_articles) > 0:
-                keyword_articles['month'] = keyword_articles['pub_date'].dt.to_period('M')
-                monthly_keyword_counts = keyword_articles.groupby('month').size()
+                monthly_keyword_counts = self._count_by_month(keyword_articles)
                 
                 keyword_trends[keyword] = {
                     "total_articles": len(keyword_articles),
@@ -237,6 +588,30 @@ class TrendAnalysis:
         
         return keyword_trends
     
+    @staticmethod
+    def _keyword_mask(texts: List[pd.Series], keyword: str) -> np.ndarray:
+        """Flag rows where any lower-cased text column contains the keyword as whole words."""
+        words = keyword.lower().split()
+        joined = r'\W+'.join(map(re.escape, words))
+        pattern = re.compile(r'(?<!\w)' + joined + r'(?!\w)')
+        # Arrow's regex engine treats \w and \b as ASCII-only, so its pass is a
+        # superset of the Unicode-aware match: \b is only added at keyword edges
+        # that are ASCII word characters, and \W+ also spans non-ASCII letters.
+        # Python's re then confirms just the candidate rows.
+        prefilter = joined
+        if ASCII_WORD_CHAR.match(words[0][0]):
+            prefilter = r'\b' + prefilter
+        if ASCII_WORD_CHAR.match(words[-1][-1]):
+            prefilter += r'\b'
+        mask = np.zeros(len(texts[0]), dtype=bool)
+        for text in texts:
+            candidates = np.flatnonzero(text.str.contains(prefilter, na=False).to_numpy(dtype=bool))
+            if len(candidates):
+                confirmed = text.iloc[candidates].astype(object).str.contains(pattern, na=False)
+                mask[candidates[confirmed.to_numpy(dtype=bool)]] = True
+        return mask
+    
+    @_memoize_analysis
     def source_type_analysis(self) -> Dict[str, Any]:
         """Analyze trends by source type (blog, news, rss)."""
         if self.df is None:
@@ -250,129 +625,152 @@ class TrendAnalysis:
         }
         
         # Distribution
-        source_type_counts = self.df['source_type'].value_counts()
+        source_type_counts = self._value_counts('source_type')
         source_type_analysis["distribution"] = source_type_counts.to_dict()
         
         # Temporal patterns by source type
         if 'pub_date' in self.df.columns:
-            for source_type in self.df['source_type'].unique():
-                type_data = self.df[self.df['source_type'] == source_type]
-                if len(type_data) > 10:
-                    daily_counts = type_data.groupby(type_data['pub_date'].dt.date).size()
+            daily_stats = self._daily_stats('source_type')
+            for source_type in self._appearance_order('source_type'):
+                row = daily_stats.loc[source_type]
+                if row['total'] > 10:
                     source_type_analysis["temporal_patterns"][source_type] = {
-                        "avg_daily_articles": float(daily_counts.mean()),
-                        "peak_day": str(daily_counts.idxmax()) if len(daily_counts) > 0 else None,
-                        "consistency": float(1 - daily_counts.std() / daily_counts.mean()) if daily_counts.mean() > 0 else 0
+                        "avg_daily_articles": float(row['mean']),
+                        "peak_day": str(row['peak_day']),
+                        "consistency": float(1 - row['std'] / row['mean']) if row['mean'] > 0 else 0
                     }
         
         # Content characteristics by source type
         if 'title' in self.df.columns:
-            title_lengths_by_type = self.df.groupby('source_type')['title'].apply(lambda x: x.str.len().mean())
+            title_lengths_by_type = self._mean_length('title', 'source_type')
             source_type_analysis["content_characteristics"]["avg_title_length"] = title_lengths_by_type.to_dict()
         
         if 'summary' in self.df.columns:
-            summary_lengths_by_type = self.df.groupby('source_type')['summary'].apply(lambda x: x.str.len().mean())
+            summary_lengths_by_type = self._mean_length('summary', 'source_type')
             source_type_analysis["content_characteristics"]["avg_summary_length"] = summary_lengths_by_type.to_dict()
         
         # Performance comparison
-        source_type_stats = self.df.groupby('source_type').agg({
-            'title': 'count',
-            'source': 'nunique'
-        }).rename(columns={'title': 'total_articles', 'source': 'unique_sources'})
+        cells = self.aggregate_cube['title_count'].reset_index()
+        source_type_stats = cells.groupby('source_type', observed=True).agg(
+            total_articles=('title_count', 'sum'),
+            unique_sources=('source', 'nunique')
+        )
         
         source_type_stats['avg_articles_per_source'] = source_type_stats['total_articles'] / source_type_stats['unique_sources']
         source_type_analysis["performance_comparison"] = source_type_stats.to_dict('index')
         
         return source_type_analysis
     
-    def generate_trend_visualizations(self, output_dir: str = "data_output/reports"):
-        """Generate trend visualizations."""
+    def generate_trend_visualizations(self, output_dir: str = "data_output/reports", force: bool = False):
+        """Generate trend visualizations.
+        
+        Plotting is skipped when every chart in ``output_dir`` is already newer
+        than the CSV it would be drawn from, unless ``force`` is set.
+        """
         if self.df is None:
             print("No data loaded for visualization")
             return
         
+        if not force and self._charts_are_current(output_dir):
+            print(f"Trend visualizations in {output_dir} are up to date")
+            return
+        
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
         
-        # Set style
-        plt.style.use('seaborn-v0_8')
-        sns.set_palette("husl")
-        
-        # 1. Daily trend over time
-        if 'pub_date' in self.df.columns:
-            plt.figure(figsize=(15, 6))
-            daily_counts = self.df.groupby(self.df['pub_date'].dt.date).size()
-            plt.plot(daily_counts.index, daily_counts.values, marker='o', linewidth=2, markersize=4)
-            plt.xlabel('Date')
-            plt.ylabel('Number of Articles')
-            plt.title('Daily Article Publication Trend')
-            plt.xticks(rotation=45)
-            plt.grid(True, alpha=0.3)
-            plt.tight_layout()
-            plt.savefig(f"{output_dir}/daily_trend.png", dpi=300, bbox_inches='tight')
-            plt.close()
-        
-        # 2. Monthly trend
-        if 'pub_date' in self.df.columns:
-            plt.figure(figsize=(12, 6))
-            monthly_counts = self.df.groupby(self.df['pub_date'].dt.to_period('M')).size()
-            plt.bar(range(len(monthly_counts)), monthly_counts.values, alpha=0.7)
-            plt.xlabel('Month')
-            plt.ylabel('Number of Articles')
-            plt.title('Monthly Article Publication Trend')
-            plt.xticks(range(len(monthly_counts)), [str(x) for x in monthly_counts.index], rotation=45)
-            plt.grid(True, alpha=0.3)
-            plt.tight_layout()
-            plt.savefig(f"{output_dir}/monthly_trend.png", dpi=300, bbox_inches='tight')
-            plt.close()
-        
-        # 3. Source type comparison over time
-        if 'pub_date' in self.df.columns:
-            plt.figure(figsize=(15, 6))
-            for source_type in self.df['source_type'].unique():
-                type_data = self.df[self.df['source_type'] == source_type]
-                monthly_counts = type_data.groupby(type_data['pub_date'].dt.to_period('M')).size()
-                plt.plot(range(len(monthly_counts)), monthly_counts.values, marker='o', label=source_type, linewidth=2)
+        # One figure is reused for every chart instead of reallocating the canvas
+        plt = _pyplot()
+        fig, ax = plt.subplots()
+        try:
+            # 1. Daily trend over time
+            if 'pub_date' in self.df.columns:
+                self._reset_chart(fig, ax, (15, 6))
+                daily_counts = self.daily_counts
+                marker = 'o' if len(daily_counts) <= DAILY_MARKER_LIMIT else None
+                ax.plot(daily_counts.index, daily_counts.values, marker=marker, linewidth=2, markersize=4,
+                        rasterized=True)
+                ax.set_xlabel('Date')
+                ax.set_ylabel('Number of Articles')
+                ax.set_title('Daily Article Publication Trend')
+                ax.tick_params(axis='x', labelrotation=45)
+                ax.grid(True, alpha=0.3)
+                self._save_chart(fig, f"{output_dir}/daily_trend.png")
             
-            plt.xlabel('Month')
-            plt.ylabel('Number of Articles')
-            plt.title('Monthly Trend by Source Type')
-            plt.legend()
-            plt.grid(True, alpha=0.3)
-            plt.tight_layout()
-            plt.savefig(f"{output_dir}/source_type_trends.png", dpi=300, bbox_inches='tight')
-            plt.close()
-        
-        # 4. Seasonal patterns
-        if 'pub_date' in self.df.columns:
-            plt.figure(figsize=(10, 6))
-            self.df['season'] = self.df['pub_date'].dt.month.map({
-                12: 'Winter', 1: 'Winter', 2: 'Winter',
-                3: 'Spring', 4: 'Spring', 5: 'Spring',
-                6: 'Summer', 7: 'Summer', 8: 'Summer',
-                9: 'Fall', 10: 'Fall', 11: 'Fall'
-            })
-            seasonal_counts = self.df.groupby('season').size()
-            plt.pie(seasonal_counts.values, labels=seasonal_counts.index, autopct='%1.1f%%')
-            plt.title('Seasonal Distribution of Articles')
-            plt.tight_layout()
-            plt.savefig(f"{output_dir}/seasonal_patterns.png", dpi=300, bbox_inches='tight')
-            plt.close()
-        
-        # 5. Top sources performance comparison
-        plt.figure(figsize=(12, 8))
-        source_counts = self.df['source'].value_counts().head(15)
-        colors = plt.cm.viridis(np.linspace(0, 1, len(source_counts)))
-        plt.barh(range(len(source_counts)), source_counts.values, color=colors)
-        plt.yticks(range(len(source_counts)), source_counts.index)
-        plt.xlabel('Number of Articles')
-        plt.title('Top 15 Sources Performance')
-        plt.tight_layout()
-        plt.savefig(f"{output_dir}/source_performance.png", dpi=300, bbox_inches='tight')
-        plt.close()
+            # 2. Monthly trend
+            if 'pub_date' in self.df.columns:
+                self._reset_chart(fig, ax, (12, 6))
+                monthly_counts = self._by_month(self._daily_totals())
+                ax.bar(range(len(monthly_counts)), monthly_counts.values, alpha=0.7)
+                ax.set_xlabel('Month')
+                ax.set_ylabel('Number of Articles')
+                ax.set_title('Monthly Article Publication Trend')
+                ax.set_xticks(range(len(monthly_counts)), [str(x) for x in monthly_counts.index], rotation=45)
+                ax.grid(True, alpha=0.3)
+                self._save_chart(fig, f"{output_dir}/monthly_trend.png")
+            
+            # 3. Source type comparison over time
+            if 'pub_date' in self.df.columns:
+                self._reset_chart(fig, ax, (15, 6))
+                daily_by_type = self._daily_by('source_type')
+                for source_type in self._appearance_order('source_type'):
+                    monthly_counts = self._by_month(daily_by_type.loc[source_type])
+                    ax.plot(range(len(monthly_counts)), monthly_counts.values, marker='o', label=source_type, linewidth=2)
+                
+                ax.set_xlabel('Month')
+                ax.set_ylabel('Number of Articles')
+                ax.set_title('Monthly Trend by Source Type')
+                ax.legend()
+                ax.grid(True, alpha=0.3)
+                self._save_chart(fig, f"{output_dir}/source_type_trends.png")
+            
+            # 4. Seasonal patterns
+            if 'pub_date' in self.df.columns:
+                self._reset_chart(fig, ax, (10, 6))
+                seasonal_counts = self._by_season(self._daily_totals())
+                ax.pie(seasonal_counts.values, labels=seasonal_counts.index, autopct='%1.1f%%')
+                ax.set_title('Seasonal Distribution of Articles')
+                self._save_chart(fig, f"{output_dir}/seasonal_patterns.png")
+            
+            # 5. Top sources performance comparison
+            self._reset_chart(fig, ax, (12, 8))
+            source_counts = self._value_counts('source').head(15)
+            colors = plt.cm.viridis(np.linspace(0, 1, len(source_counts)))
+            ax.barh(range(len(source_counts)), source_counts.values, color=colors)
+            ax.set_yticks(range(len(source_counts)), source_counts.index)
+            ax.set_xlabel('Number of Articles')
+            ax.set_title('Top 15 Sources Performance')
+            self._save_chart(fig, f"{output_dir}/source_performance.png")
+        finally:
+            plt.close(fig)
         
         print(f"Trend visualizations saved to {output_dir}")
     
+    def _charts_are_current(self, output_dir: str) -> bool:
+        """Check whether all trend charts exist and are newer than the file the data was loaded from."""
+        if self._source_path is None or not os.path.exists(self._source_path):
+            return False
+        data_mtime = os.path.getmtime(self._source_path)
+        for chart in TREND_CHARTS:
+            chart_path = os.path.join(output_dir, chart)
+            if not os.path.exists(chart_path) or os.path.getmtime(chart_path) < data_mtime:
+                return False
+        return True
+    
+    @staticmethod
+    def _reset_chart(fig, ax, size: Tuple[int, int]):
+        """Clear the shared axes and resize the figure for the next chart."""
+        ax.clear()
+        ax.set_frame_on(True)
+        ax.set_aspect('auto')
+        ax.tick_params(axis='both', labelrotation=0)
+        fig.set_size_inches(size)
+    
+    @staticmethod
+    def _save_chart(fig, path: str):
+        """Lay out and write the current chart."""
+        fig.tight_layout()
+        fig.savefig(path, dpi=300, bbox_inches='tight')
+    
     def _stringify_dict_keys(self, d):
         """Recursively convert all dictionary keys to strings, including inside lists of dicts and tuples as keys."""
         if isinstance(d, dict):
@@ -401,7 +799,8 @@ class TrendAnalysis:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         exported_files = {}
         
-        # Generate all trend analyses
+        # Generate all trend analyses; they share the memoized aggregate cube, so it
+        # is built once
         temporal_trends = self.temporal_trend_analysis()
         source_comparison = self.source_comparative_analysis()
         keyword_trends = self.keyword_trend_analysis()
@@ -418,13 +817,13 @@ class TrendAnalysis:
         
         # Export to JSON
         json_path = f"{output_dir}/trend_analysis_{timestamp}.json"
-        with open(json_path, 'w') as f:
-            json.dump(all_trends, f, indent=2, default=custom_json_encoder)
+        with open(json_path, 'wb') as f:
+            f.write(jsonio.dumps(all_trends, indent=True, default=custom_json_encoder))
         exported_files["json"] = json_path
         
         # Export temporal data to CSV
         if 'pub_date' in self.df.columns:
-            daily_counts = self.df.groupby(self.df['pub_date'].dt.date).size().reset_index()
+            daily_counts = self.daily_counts.reset_index()
             daily_counts.columns = ['date', 'article_count']
             csv_path = f"{output_dir}/daily_trends_{timestamp}.csv"
             daily_counts.to_csv(csv_path, index=False)
@@ -4,58 +4,172 @@ Web Scraping CLI Commands
 Command implementations for the web scraping project
 """
 
-import json
+import copy
+import csv
+import functools
+import importlib.util
+import itertools
 import os
+import subprocess
 import sys
-import time
-from datetime import datetime
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
-from pathlib import Path
+from collections import Counter, deque
+from operator import itemgetter
 
 # Add src to path for imports
 sys.path.append('src')
 
-from src.scrapers.Master import Master
-from src.scrapers.Task import Task
 from src.utils.logger import log
 from src.utils.configs import generate_tasks
-from multiprocessing import Queue, Manager
+from src.utils import jsonio
+from multiprocessing import Queue
+
+# required Task fields, in constructor order
+task_fields = itemgetter("priority", "url", "type")
+# per-type scrape output is saved as <type>_data.json
+DATA_FILE_SUFFIX = '_data.json'
+# task types add_task accepts
+TASK_TYPES = frozenset({'news', 'rss', 'blog'})
+# optional packages system_status reports on, as (module, label)
+STATUS_DEPENDENCIES = (
+    ('selenium', 'Selenium'),
+    ('scrapy', 'Scrapy'),
+    ('matplotlib', 'Matplotlib'),
+    ('seaborn', 'Seaborn'),
+)
+# search_data lists at most this many hits
+SEARCH_RESULT_LIMIT = 10
+
+
+@functools.lru_cache(maxsize=None)
+def _is_installed(module):
+    """Whether module can be imported; find_spec locates it without running it"""
+    return importlib.util.find_spec(module) is not None
+
+
+def _make_task(task_id, task):
+    """Task for one config entry; the scraper package is only imported once a run needs it"""
+    from src.scrapers.Task import Task
+    return Task(task_id, *task_fields(task), task.get("search_word"))
+
+
+@functools.lru_cache(maxsize=4)
+def _scan_files(dir_path, mtime_ns):
+    """Regular files in dir_path; mtime_ns is part of the key so any add/remove/rename re-scans"""
+    with os.scandir(dir_path) as it:
+        return tuple(entry for entry in it if entry.is_file())
+
+
+# The only non-ASCII characters whose str.lower() contains an ASCII letter
+# (U+0130 -> 'i', U+212A -> 'k'), raw and \u-escaped as in lower-cased JSON bytes
+_LOWER_TO_ASCII_MARKERS = {
+    'i': ('\u0130'.encode(), b'\\u0130'),
+    'k': ('\u212a'.encode(), b'\\u212a'),
+}
+
+
+def _raw_may_match(raw, search_term):
+    """False only when no string in the raw JSON bytes can contain search_term"""
+    # Only plain ASCII terms are checked: JSON escapes '"', '\\' and control
+    # characters, and bytes.lower() only folds ASCII letters
+    if not (search_term.isascii() and search_term.isprintable()) or '"' in search_term or '\\' in search_term:
+        return True
+    lowered = raw.lower()
+    if search_term.encode() in lowered:
+        return True
+    return any(marker in lowered
+               for letter, markers in _LOWER_TO_ASCII_MARKERS.items() if letter in search_term
+               for marker in markers)
+
+
+def _search_file(file_path, search_term, limit=None):
+    """Up to limit items of a JSON data file with a text field containing search_term"""
+    # Module-level and returning a list so it can run in a worker process
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    # A single C-level scan of the bytes skips parsing files that cannot match
+    if not _raw_may_match(raw, search_term):
+        return []
+    data = jsonio.loads(raw)
+    if not isinstance(data, list):
+        return []
+    # Check text fields one at a time and stop at the first hit
+    hits = (item for item in data
+            if any(search_term in value.lower() for value in item.values() if isinstance(value, str)))
+    return list(itertools.islice(hits, limit))
+
+
+def _count_file(file_path):
+    """Number of items in a JSON data file, or None if it doesn't hold a list"""
+    # Module-level so it can run in a worker process; only the count is sent back
+    with open(file_path, 'rb') as f:
+        data = jsonio.loads(f.read())
+    return len(data) if isinstance(data, list) else None
 
 
 class WebScrapingCommands:
     def __init__(self, config_file="config.json", results_dir="data_output/raw"):
         self.config_file = config_file
         self.results_dir = results_dir
+        self._json_cache = {}
+        # Item counts for this session; .count sidecars carry them across runs
+        self._count_cache = {}
+        self._summary_cache = None
+
+    def _load_json(self, path):
+        """Load a JSON file, re-parsing only when its mtime or size changed"""
+        # The cached object is shared; callers that edit it work on a copy
+        st = os.stat(path)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._json_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        with open(path, 'rb') as f:
+            data = jsonio.loads(f.read())
+        self._json_cache[path] = (key, data)
+        return data
+
+    def _load_config(self):
+        """Load config through the JSON cache"""
+        return self._load_json(self.config_file)
+
+    def _save_config(self, config):
+        """Save config and keep it as the cached copy"""
+        with open(self.config_file, 'wb') as f:
+            f.write(jsonio.dumps(config, indent=True))
+        st = os.stat(self.config_file)
+        self._json_cache[self.config_file] = ((st.st_mtime_ns, st.st_size), config)
+
+    def _run_tasks(self, tasks, completed_message):
+        """Run tasks on a Master with fresh queues, then show the summary"""
+        # The scraping stack (and pandas with it) is only loaded when a run starts
+        from src.scrapers.Master import Master
+
+        # Create multiprocessing objects; a worker terminated mid-get can leave
+        # a queue's lock held, so queues are never reused across runs
+        task_queue = Queue()
+        result_queue = Queue()
+        status_queue = Queue()
+
+        # Master.run exports the combined results itself
+        master = Master(task_queue=task_queue, result_queue=result_queue,
+                        status_queue=status_queue)
+        master.run(tasks)
+
+        print(completed_message)
+        self.show_completion_summary()
 
     def run_all_tasks(self):
         """Run all configured tasks"""
         print("\n🚀 Starting all scraping tasks...")
         try:
-            # Create multiprocessing objects
-            task_queue = Queue()
-            result_queue = Queue()
-            manager = Manager()
-            worker_status = manager.dict()
-
             # Get tasks from config
-            tasks = generate_tasks()
-            tasks = [Task(i, tasks[i]["priority"], tasks[i]["url"], tasks[i]["type"],
-                          tasks[i].get("search_word"))
-                     for i in range(len(tasks))]
-
-            # Create and run master
-            master = Master(task_queue=task_queue, result_queue=result_queue,
-                            worker_status=worker_status)
+            raw_tasks = generate_tasks()
+            tasks = [_make_task(i, task) for i, task in enumerate(raw_tasks)]
 
             print(f"📋 Loaded {len(tasks)} tasks")
             print("⏳ Starting workers...")
 
-            master.run(tasks)
-            master.export_combined_results()
-            print("✅ Scraping completed successfully!")
-            self.show_completion_summary()
+            self._run_tasks(tasks, "✅ Scraping completed successfully!")
 
         except Exception as e:
             print(f"❌ Error during scraping: {e}")
@@ -79,13 +193,8 @@ class WebScrapingCommands:
     def run_filtered_tasks(self, task_type):
         """Run tasks filtered by type"""
         try:
-            tasks = generate_tasks()
-            filtered_tasks = []
-
-            for i, task in enumerate(tasks):
-                if task["type"] == task_type:
-                    filtered_tasks.append(Task(i, task["priority"], task["url"], task["type"],
-                                               task.get("search_word")))
+            tasks = generate_tasks(task_type=task_type)
+            filtered_tasks = [_make_task(i, task) for i, task in tasks]
 
             if not filtered_tasks:
                 print(f"❌ No {task_type} tasks found in configuration.")
@@ -93,20 +202,7 @@ class WebScrapingCommands:
 
             print(f"📋 Found {len(filtered_tasks)} {task_type} tasks")
 
-            # Create multiprocessing objects
-            task_queue = Queue()
-            result_queue = Queue()
-            manager = Manager()
-            worker_status = manager.dict()
-
-            # Create and run master
-            master = Master(task_queue=task_queue, result_queue=result_queue,
-                            worker_status=worker_status)
-
-            master.run(filtered_tasks)
-            master.export_combined_results()
-            print(f"✅ {task_type.capitalize()} scraping completed!")
-            self.show_completion_summary()
+            self._run_tasks(filtered_tasks, f"✅ {task_type.capitalize()} scraping completed!")
 
         except Exception as e:
             print(f"❌ Error during {task_type} scraping: {e}")
@@ -129,8 +225,7 @@ class WebScrapingCommands:
             for idx in task_indices:
                 if 0 <= idx < len(tasks):
                     task = tasks[idx]
-                    selected_tasks.append(Task(idx, task["priority"], task["url"], task["type"],
-                                               task.get("search_word")))
+                    selected_tasks.append(_make_task(idx, task))
 
             if not selected_tasks:
                 print("❌ No valid tasks selected.")
@@ -138,20 +233,7 @@ class WebScrapingCommands:
 
             print(f"📋 Running {len(selected_tasks)} selected tasks...")
 
-            # Create multiprocessing objects
-            task_queue = Queue()
-            result_queue = Queue()
-            manager = Manager()
-            worker_status = manager.dict()
-
-            # Create and run master
-            master = Master(task_queue=task_queue, result_queue=result_queue,
-                            worker_status=worker_status)
-
-            master.run(selected_tasks)
-
-            print("✅ Custom scraping completed!")
-            self.show_completion_summary()
+            self._run_tasks(selected_tasks, "✅ Custom scraping completed!")
 
         except (ValueError, IndexError) as e:
             print(f"❌ Invalid selection: {e}")
@@ -161,8 +243,7 @@ class WebScrapingCommands:
         print("\n📝 Edit Tasks")
 
         try:
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
+            config = copy.deepcopy(self._load_config())
 
             print("\nCurrent tasks:")
             for i, task in enumerate(config["tasks"]):
@@ -190,12 +271,26 @@ class WebScrapingCommands:
         except Exception as e:
             print(f"❌ Error editing tasks: {e}")
 
+    @staticmethod
+    def _read_priority():
+        """Prompt for a task priority; None (after printing why) if it isn't 1-10"""
+        value = input("Priority (1-10): ").strip()
+        try:
+            priority = int(value)
+        except ValueError:
+            print("❌ Invalid priority.")
+            return None
+        if 1 <= priority <= 10:
+            return priority
+        print("❌ Priority must be between 1 and 10.")
+        return None
+
     def add_task(self, config):
         """Add a new task"""
         print("\n➕ Add New Task")
 
         task_type = input("Task type (news/rss/blog): ").strip().lower()
-        if task_type not in ['news', 'rss', 'blog']:
+        if task_type not in TASK_TYPES:
             print("❌ Invalid task type.")
             return
 
@@ -207,13 +302,8 @@ class WebScrapingCommands:
                 url = "https://www.foxnews.com/"
             else:
                 url = "https://www.bbc.com/"
-            try:
-                priority = int(input("Priority (1-10): ").strip())
-                if not 1 <= priority <= 10:
-                    print("❌ Priority must be between 1 and 10.")
-                    return
-            except ValueError:
-                print("❌ Invalid priority.")
+            priority = self._read_priority()
+            if priority is None:
                 return
 
             new_task = {
@@ -223,13 +313,8 @@ class WebScrapingCommands:
             }
         elif task_type == "rss":
             searchword = input("type a search keyword: ")
-            try:
-                priority = int(input("Priority (1-10): ").strip())
-                if not 1 <= priority <= 10:
-                    print("❌ Priority must be between 1 and 10.")
-                    return
-            except ValueError:
-                print("❌ Invalid priority.")
+            priority = self._read_priority()
+            if priority is None:
                 return
             new_task = {
                 "priority": priority,
@@ -238,13 +323,8 @@ class WebScrapingCommands:
                 "search_word": searchword
             }
         else:
-            try:
-                priority = int(input("Priority (1-10): ").strip())
-                if not 1 <= priority <= 10:
-                    print("❌ Priority must be between 1 and 10.")
-                    return
-            except ValueError:
-                print("❌ Invalid priority.")
+            priority = self._read_priority()
+            if priority is None:
                 return
             new_task = {
                 "priority": priority,
@@ -253,8 +333,7 @@ class WebScrapingCommands:
             }
         config["tasks"].append(new_task)
 
-        with open(self.config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        self._save_config(config)
 
         print("✅ Task added successfully!")
 
@@ -284,8 +363,7 @@ class WebScrapingCommands:
                     print("❌ Invalid priority.")
                     return
 
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            self._save_config(config)
 
             print("✅ Task updated successfully!")
 
@@ -309,8 +387,7 @@ class WebScrapingCommands:
             if confirm == 'y':
                 del config["tasks"][task_index]
 
-                with open(self.config_file, 'w') as f:
-                    json.dump(config, f, indent=2)
+                self._save_config(config)
 
                 print("✅ Task deleted successfully!")
             else:
@@ -324,8 +401,7 @@ class WebScrapingCommands:
         print("\n🔧 Worker Settings")
 
         try:
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
+            config = copy.deepcopy(self._load_config())
 
             print(f"\nCurrent settings:")
             print(f"Min workers: {config.get('min_workers', 2)}")
@@ -339,8 +415,7 @@ class WebScrapingCommands:
             if new_max:
                 config['max_workers'] = int(new_max)
 
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            self._save_config(config)
 
             print("✅ Worker settings updated!")
 
@@ -352,8 +427,7 @@ class WebScrapingCommands:
         print("\n🌐 Proxy Settings")
 
         try:
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
+            config = copy.deepcopy(self._load_config())
 
             print(f"\nCurrent proxies: {len(config.get('proxies', []))}")
             for i, proxy in enumerate(config.get('proxies', [])):
@@ -393,8 +467,7 @@ class WebScrapingCommands:
             elif choice == '4':
                 return
 
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            self._save_config(config)
 
         except Exception as e:
             print(f"❌ Error updating proxy settings: {e}")
@@ -406,6 +479,75 @@ class WebScrapingCommands:
         print("To modify rate limits, edit src/scrapers/Worker.py")
         print("Current setting: max_requests_per_second=1")
 
+    def _data_entries(self, suffixes):
+        """List files in results_dir ending with suffixes, reusing the last scan until the directory changes"""
+        entries = _scan_files(self.results_dir, os.stat(self.results_dir).st_mtime_ns)
+        return [entry for entry in entries if entry.name.endswith(suffixes)]
+
+    @staticmethod
+    def _record_count(path, key, count):
+        """Write a .count sidecar for path if it still has the (mtime, size) key it was counted at"""
+        try:
+            st = os.stat(path)
+            if (st.st_mtime_ns, st.st_size) == key:
+                jsonio.write_count(path, count)
+        except OSError as e:
+            log.warning(f"Could not record item count for {path}: {e}")
+
+    def _item_counts(self, entries):
+        """Item count (or None, or the raised exception) per data file, in entry order"""
+        # Counts are cached by (mtime, size); only changed files are parsed again
+        keys = {}
+        pending = []
+        for entry in entries:
+            try:
+                # os.stat, not entry.stat(): scanned entries are reused and keep their first stat
+                st = os.stat(entry.path)
+            except OSError:
+                # Let _count_file raise the error for this entry
+                pending.append(entry.path)
+                continue
+            keys[entry.path] = (st.st_mtime_ns, st.st_size)
+            cached = self._count_cache.get(entry.path)
+            if cached is not None and cached[0] == keys[entry.path]:
+                continue
+            # The writer records the count of each file it saves next to it
+            count = jsonio.read_count(entry.path)
+            if count is not None:
+                self._count_cache[entry.path] = (keys[entry.path], count)
+            else:
+                pending.append(entry.path)
+
+        results = {}
+        if len(pending) > 1:
+            # Parsing is CPU-bound, so several files are counted in parallel processes
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=min(len(pending), os.cpu_count() or 1)) as executor:
+                futures = {path: executor.submit(_count_file, path) for path in pending}
+            for path, future in futures.items():
+                results[path] = future.exception() or future.result()
+        else:
+            for path in pending:
+                try:
+                    results[path] = _count_file(path)
+                except Exception as e:
+                    results[path] = e
+
+        counts = []
+        for entry in entries:
+            if entry.path in results:
+                count = results[entry.path]
+                if entry.path in keys and not isinstance(count, Exception):
+                    self._count_cache[entry.path] = (keys[entry.path], count)
+                    # Record per-type counts for the next run, as the writer does;
+                    # skipped if the file changed while it was being counted
+                    if count is not None and entry.name.endswith(DATA_FILE_SUFFIX):
+                        self._record_count(entry.path, keys[entry.path], count)
+            else:
+                count = self._count_cache[entry.path][1]
+            counts.append(count)
+        return counts
+
     def data_overview(self):
         """Show data overview"""
         print("\n📈 Data Overview")
@@ -414,30 +556,40 @@ class WebScrapingCommands:
             print("❌ No data directory found.")
             return
 
-        data_files = [f for f in os.listdir(self.results_dir) if f.endswith('.json')]
+        data_files = self._data_entries('.json')
 
         if not data_files:
             print("❌ No data files found.")
             return
 
-        print(f"\n📁 Data files in {self.results_dir}:")
+        lines = [f"\n📁 Data files in {self.results_dir}:"]
         total_items = 0
 
-        for file in data_files:
-            file_path = os.path.join(self.results_dir, file)
-            try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        count = len(data)
-                    else:
-                        count = 1
-                    total_items += count
-                    print(f"  📄 {file}: {count} items")
-            except Exception as e:
-                print(f"  ❌ {file}: Error reading file")
-
-        print(f"\n📊 Total items: {total_items}")
+        for entry, count in zip(data_files, self._item_counts(data_files)):
+            file = entry.name
+            if isinstance(count, Exception):
+                lines.append(f"  ❌ {file}: Error reading file")
+                continue
+            if count is None:
+                count = 1
+            total_items += count
+            lines.append(f"  📄 {file}: {count} items")
+
+        lines.append(f"\n📊 Total items: {total_items}")
+        # One write for the whole listing instead of one per file
+        print("\n".join(lines))
+
+    def _load_summary(self, summary_file):
+        """Read the summary CSV as (header, rows), re-parsing only when the file changed"""
+        st = os.stat(summary_file)
+        key = (summary_file, st.st_mtime_ns, st.st_size)
+        if self._summary_cache is None or self._summary_cache[0] != key:
+            with open(summary_file, newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                rows = [row for row in reader if row]
+            self._summary_cache = (key, (header, rows))
+        return self._summary_cache[1]
 
     def performance_analytics(self):
         """Show performance analytics"""
@@ -449,15 +601,24 @@ class WebScrapingCommands:
             return
 
         try:
-            df = pd.read_csv(summary_file)
-            print("\n📈 Task Performance:")
-            print(df.to_string(index=False))
-
-            if len(df) > 1:  # More than just summary rows
-                task_data = df[df['task_id'].notna()]  # Filter out summary rows
-                if not task_data.empty:
-                    avg_time = task_data['processing_time'].mean()
-                    total_time = task_data['processing_time'].sum()
+            header, rows = self._load_summary(summary_file)
+            # Right-aligned columns with NaN for empty cells, as DataFrame.to_string prints them
+            cells = [[value or 'NaN' for value in row] for row in rows]
+            widths = [max(map(len, column)) for column in zip(header, *cells)]
+            lines = ["\n📈 Task Performance:"]
+            lines.extend(" ".join(value.rjust(width) for value, width in zip(row, widths))
+                         for row in [header, *cells])
+            print("\n".join(lines))
+
+            if len(rows) > 1:  # More than just summary rows
+                task_id = header.index('task_id')
+                processing_time = header.index('processing_time')
+                # Filter out summary rows
+                task_times = [float(row[processing_time]) for row in rows
+                              if row[task_id] and row[processing_time]]
+                if task_times:
+                    total_time = sum(task_times)
+                    avg_time = total_time / len(task_times)
                     print(f"\n⏱️  Average processing time: {avg_time:.2f} seconds")
                     print(f"⏱️  Total processing time: {total_time:.2f} seconds")
 
@@ -465,33 +626,28 @@ class WebScrapingCommands:
             print(f"❌ Error reading performance data: {e}")
 
     def run_all_tests(self):
-        try:
-            import pytest
+        """Run the test suite in a child process so test tooling never loads into the CLI; returns its exit code"""
+        if importlib.util.find_spec("pytest") is not None:
             print("Running all tests with pytest...\n")
-            pytest.main(["-v", "tests/"])
-        except ImportError:
+            command = [sys.executable, "-m", "pytest", "-v", "tests/"]
+        else:
             print("pytest not installed, falling back to unittest discovery...\n")
-            import unittest
-            loader = unittest.TestLoader()
-            suite = loader.discover('tests')
-            runner = unittest.TextTestRunner(verbosity=2)
-            result = runner.run(suite)
-            sys.exit(not result.wasSuccessful())
+            command = [sys.executable, "-m", "unittest", "discover", "-s", "tests", "-v"]
+        result = subprocess.run(command)
+        if result.returncode != 0:
+            print(f"\n❌ Tests failed (exit code {result.returncode})")
+        return result.returncode
     def task_summary(self):
         """Show task summary"""
         print("\n📋 Task Summary")
 
         try:
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
+            config = self._load_config()
 
             tasks = config.get('tasks', [])
             print(f"\n📋 Total tasks configured: {len(tasks)}")
 
-            task_types = {}
-            for task in tasks:
-                task_type = task['type']
-                task_types[task_type] = task_types.get(task_type, 0) + 1
+            task_types = Counter(task['type'] for task in tasks)
 
             print("\n📊 Task breakdown:")
             for task_type, count in task_types.items():
@@ -524,23 +680,22 @@ class WebScrapingCommands:
             print("❌ No data directory found.")
             return
 
-        files = os.listdir(self.results_dir)
-        json_files = [f for f in files if f.endswith('.json')]
-        csv_files = [f for f in files if f.endswith('.csv')]
+        # The listing may be cached; sizes are read fresh since files change in place
+        json_files, csv_files = [], []
+        for entry in self._data_entries(('.json', '.csv')):
+            (json_files if entry.name.endswith('.json') else csv_files).append(entry)
 
+        lines = []
         if json_files:
-            print("\n📄 JSON Files:")
-            for file in json_files:
-                file_path = os.path.join(self.results_dir, file)
-                size = os.path.getsize(file_path)
-                print(f"  📄 {file} ({size} bytes)")
+            lines.append("\n📄 JSON Files:")
+            lines.extend(f"  📄 {entry.name} ({os.path.getsize(entry.path)} bytes)" for entry in json_files)
 
         if csv_files:
-            print("\n📊 CSV Files:")
-            for file in csv_files:
-                file_path = os.path.join(self.results_dir, file)
-                size = os.path.getsize(file_path)
-                print(f"  📊 {file} ({size} bytes)")
+            lines.append("\n📊 CSV Files:")
+            lines.extend(f"  📊 {entry.name} ({os.path.getsize(entry.path)} bytes)" for entry in csv_files)
+
+        if lines:
+            print("\n".join(lines))
 
     def clean_old_data(self):
         """Clean old data files"""
@@ -551,8 +706,7 @@ class WebScrapingCommands:
             return
 
         try:
-            files = os.listdir(self.results_dir)
-            data_files = [f for f in files if f.endswith(('.json', '.csv'))]
+            data_files = self._data_entries(('.json', '.csv'))
 
             if not data_files:
                 print("❌ No data files to clean.")
@@ -562,9 +716,18 @@ class WebScrapingCommands:
             confirm = input("Are you sure you want to delete all data files? (y/N): ").strip().lower()
 
             if confirm == 'y':
-                for file in data_files:
-                    file_path = os.path.join(self.results_dir, file)
-                    os.remove(file_path)
+                paths = [entry.path for entry in data_files]
+                # Count and URL sidecars go with their data files
+                from src.data.processors import URLS_SUFFIX
+                sidecars = [entry.path for entry in self._data_entries((jsonio.COUNT_SUFFIX, URLS_SUFFIX))]
+                # Each unlink is a latency-bound syscall, so overlap them on threads
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=min(len(paths) + len(sidecars), 16)) as executor:
+                    list(executor.map(os.remove, paths + sidecars))
+                # Drop cached parses and counts of the removed files
+                for path in paths:
+                    self._json_cache.pop(path, None)
+                    self._count_cache.pop(path, None)
                 print("✅ All data files deleted!")
             else:
                 print("❌ Cleanup cancelled.")
@@ -578,6 +741,44 @@ class WebScrapingCommands:
         print("⚠️  Data is already available in JSON format in src/data/")
         print("You can access the files directly or use the data visualization features.")
 
+    def _iter_search_hits(self, data_files, search_term, limit):
+        """Yield {'file', 'item'} hits in file order, scanning at most limit hits per file"""
+        # Parsing is CPU-bound, so several files are scanned in parallel processes.
+        # Only one file per worker is in flight, so files past the point where the
+        # caller stops pulling hits are never submitted.
+        if len(data_files) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            workers = min(len(data_files), os.cpu_count() or 1)
+            entries = iter(data_files)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                pending = deque(
+                    (entry, executor.submit(_search_file, entry.path, search_term, limit))
+                    for entry in itertools.islice(entries, workers)
+                )
+                while pending:
+                    entry, future = pending.popleft()
+                    next_entry = next(entries, None)
+                    if next_entry is not None:
+                        pending.append((next_entry, executor.submit(_search_file, next_entry.path, search_term, limit)))
+                    yield from self._file_hits(entry, future.result)
+        else:
+            for entry in data_files:
+                yield from self._file_hits(entry, functools.partial(_search_file, entry.path, search_term, limit))
+
+    @staticmethod
+    def _file_hits(entry, scan):
+        """Yield {'file', 'item'} hits from one file's scan, reporting a file that cannot be read"""
+        try:
+            items = scan()
+        except Exception as e:
+            print(f"❌ Error reading {entry.name}: {e}")
+            return
+        for item in items:
+            yield {
+                'file': entry.name,
+                'item': item
+            }
+
     def search_data(self):
         """Search through scraped data"""
         print("\n🔍 Search Data")
@@ -591,45 +792,29 @@ class WebScrapingCommands:
             print("❌ No search term provided.")
             return
 
-        data_files = [f for f in os.listdir(self.results_dir) if f.endswith('_data.json')]
-        print([f for f in os.listdir(self.results_dir)])
+        data_files = self._data_entries(DATA_FILE_SUFFIX)
         if not data_files:
             print("❌ No data files found.")
             return
 
         print(f"\n🔍 Searching for '{search_term}'...")
-        found_items = []
 
-        for file in data_files:
-            file_path = os.path.join(self.results_dir, file)
-            try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        for item in data:
-                            # Search in title, summary, and other text fields
-                            searchable_text = ""
-                            for key, value in item.items():
-                                if isinstance(value, str):
-                                    searchable_text += value.lower() + " "
-
-                            if search_term in searchable_text:
-                                found_items.append({
-                                    'file': file,
-                                    'item': item
-                                })
-            except Exception as e:
-                print(f"❌ Error reading {file}: {e}")
+        # One hit past the limit is enough to know there are more
+        limit = SEARCH_RESULT_LIMIT + 1
+        found_items = list(itertools.islice(self._iter_search_hits(data_files, search_term, limit), limit))
 
         if found_items:
-            print(f"\n✅ Found {len(found_items)} items:")
-            for i, found in enumerate(found_items[:10]):  # Show first 10 results
+            has_more = len(found_items) > SEARCH_RESULT_LIMIT
+            count = f"{SEARCH_RESULT_LIMIT}+" if has_more else len(found_items)
+            lines = [f"\n✅ Found {count} items:"]
+            for i, found in enumerate(found_items[:SEARCH_RESULT_LIMIT]):
                 item = found['item']
                 title = item.get('title', 'No title')
-                print(f"  {i + 1}. {title} ({found['file']})")
+                lines.append(f"  {i + 1}. {title} ({found['file']})")
 
-            if len(found_items) > 10:
-                print(f"  ... and {len(found_items) - 10} more results")
+            if has_more:
+                lines.append("  ... and more results")
+            print("\n".join(lines))
         else:
             print("❌ No items found.")
 
@@ -640,63 +825,39 @@ class WebScrapingCommands:
 
         # Check configuration
         print("\n📋 Configuration:")
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                print(f"  ✅ Config file: {self.config_file}")
-                print(f"  📝 Tasks: {len(config.get('tasks', []))}")
-                print(f"  🔧 Min workers: {config.get('min_workers', 'N/A')}")
-                print(f"  🔧 Max workers: {config.get('max_workers', 'N/A')}")
-                print(f"  🌐 Proxies: {len(config.get('proxies', []))}")
-            except Exception as e:
-                print(f"  ❌ Config file error: {e}")
-        else:
+        # _load_config and _data_entries stat their path once; a missing path raises
+        try:
+            config = self._load_config()
+            print(f"  ✅ Config file: {self.config_file}")
+            print(f"  📝 Tasks: {len(config.get('tasks', []))}")
+            print(f"  🔧 Min workers: {config.get('min_workers', 'N/A')}")
+            print(f"  🔧 Max workers: {config.get('max_workers', 'N/A')}")
+            print(f"  🌐 Proxies: {len(config.get('proxies', []))}")
+        except FileNotFoundError:
             print(f"  ❌ Config file missing: {self.config_file}")
+        except Exception as e:
+            print(f"  ❌ Config file error: {e}")
 
         # Check data directory
         print("\n📁 Data Directory:")
-        if os.path.exists(self.results_dir):
-            files = os.listdir(self.results_dir)
-            data_files = [f for f in files if f.endswith(('.json', '.csv'))]
+        try:
+            data_files = self._data_entries(('.json', '.csv'))
             print(f"  ✅ Data directory: {self.results_dir}")
             print(f"  📄 Data files: {len(data_files)}")
-        else:
+        except FileNotFoundError:
             print(f"  ❌ Data directory missing: {self.results_dir}")
 
         # Check dependencies
         print("\n📦 Dependencies:")
-        try:
-            import selenium
-            print("  ✅ Selenium")
-        except ImportError:
-            print("  ❌ Selenium")
-
-        try:
-            import scrapy
-            print("  ✅ Scrapy")
-        except ImportError:
-            print("  ❌ Scrapy")
-
-        try:
-            import matplotlib
-            print("  ✅ Matplotlib")
-        except ImportError:
-            print("  ❌ Matplotlib")
-
-        try:
-            import seaborn
-            print("  ✅ Seaborn")
-        except ImportError:
-            print("  ❌ Seaborn")
+        for module, label in STATUS_DEPENDENCIES:
+            print(f"  {'✅' if _is_installed(module) else '❌'} {label}")
 
     def view_tasks(self):
         """View current tasks"""
         print("\n📋 Current Tasks")
 
         try:
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
+            config = self._load_config()
 
             tasks = config.get('tasks', [])
 
@@ -704,13 +865,15 @@ class WebScrapingCommands:
                 print("❌ No tasks configured.")
                 return
 
-            print(f"\n📋 Total tasks: {len(tasks)}")
+            lines = [f"\n📋 Total tasks: {len(tasks)}"]
 
             for i, task in enumerate(tasks):
-                print(f"\n{i + 1}. {task['type'].upper()} Task")
-                print(f"   URL: {task['url']}")
-                print(f"   Priority: {task['priority']}")
-                print(f"   Type: {task['type']}")
+                lines.append(f"\n{i + 1}. {task['type'].upper()} Task")
+                lines.append(f"   URL: {task['url']}")
+                lines.append(f"   Priority: {task['priority']}")
+                lines.append(f"   Type: {task['type']}")
+
+            print("\n".join(lines))
 
         except Exception as e:
             print(f"❌ Error reading tasks: {e}")
@@ -724,21 +887,14 @@ class WebScrapingCommands:
         print("\n✅ Scraping Completed!")
 
         if os.path.exists(self.results_dir):
-            data_files = [f for f in os.listdir(self.results_dir) if f.endswith('_data.json')]
+            data_files = self._data_entries(DATA_FILE_SUFFIX)
             total_items = 0
 
-            for file in data_files:
-                file_path = os.path.join(self.results_dir, file)
-                try:
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)
-                        if isinstance(data, list):
-                            count = len(data)
-                            data_type = file.replace('_data.json', '')
-                            print(f"  📄 {data_type.upper()}: {count} items")
-                            total_items += count
-                except:
-                    pass
+            for entry, count in zip(data_files, self._item_counts(data_files)):
+                if count is not None and not isinstance(count, Exception):
+                    data_type = entry.name.removesuffix(DATA_FILE_SUFFIX)
+                    print(f"  📄 {data_type.upper()}: {count} items")
+                    total_items += count
 
             print(f"\n📊 Total items scraped: {total_items}")
 
@@ -5,27 +5,92 @@ Main interface and menu system for the web scraping project
 """
 
 import argparse
-import json
-import os
 import sys
-import time
-from datetime import datetime
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
-from pathlib import Path
 
 # Add src to path for imports
 sys.path.append('src')
 
-from src.scrapers.Master import Master
-from src.scrapers.Task import Task
-from src.utils.logger import log
-from src.utils.configs import generate_tasks
-from multiprocessing import Queue, Manager
-
 from .commands import WebScrapingCommands
 
+try:
+    import termios
+    import tty
+except ImportError:  # Windows
+    termios = None
+
+
+def read_menu_choice(prompt):
+    """Read a single-key menu choice without waiting for Enter on a terminal"""
+    if termios is None or not sys.stdin.isatty():
+        return input(prompt).strip()
+
+    print(prompt, end='', flush=True)
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setraw(fd)
+        choice = sys.stdin.read(1)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+    # raw mode delivers Ctrl-C / Ctrl-D as plain characters
+    if choice == '\x03':
+        raise KeyboardInterrupt
+    if choice == '\x04':
+        raise EOFError
+    print(choice)
+    return choice.strip()
+
+
+def _menu(title, options, width=40, footer=False):
+    """Menu text, built once so each redraw is a single print"""
+    rule = "=" * width
+    lines = ["", rule, title, rule, *options]
+    if footer:
+        lines.append(rule)
+    return "\n".join(lines)
+
+
+MAIN_MENU = _menu("🌐 WEB SCRAPING CLI INTERFACE", [
+    "1. 🚀 Start Scraping",
+    "2. ⚙️  Configure Settings",
+    "3. 📊 View Reports & Analytics",
+    "4. 📁 Run tests",
+    "5. 📁 Manage Data",
+    "6. 🔧 System Status",
+    "7. 📋 View Tasks",
+    "8. ❌ Exit",
+], width=50, footer=True)
+
+START_SCRAPING_MENU = _menu("🚀 START SCRAPING", [
+    "1. 🔄 Run All Tasks",
+    "2. 📰 News Only",
+    "3. 📻 RSS Only",
+    "4. 📝 Blog Only",
+    "5. 🎯 Custom Selection",
+    "6. ⬅️  Back to Main Menu",
+])
+
+CONFIGURE_SETTINGS_MENU = _menu("⚙️  CONFIGURE SETTINGS", [
+    "1. 📝 Edit Tasks",
+    "2. 🔧 Worker Settings",
+    "3. ⬅️  Back to Main Menu",
+])
+
+REPORTS_MENU = _menu("📊 REPORTS & ANALYTICS", [
+    "1. 📈 Data Overview",
+    "2. 📊 Performance Analytics",
+    "3. 📋 Task Summary",
+    "4. 📄 Generate HTML Report",
+    "5. ⬅️  Back to Main Menu",
+])
+
+MANAGE_DATA_MENU = _menu("📁 MANAGE DATA", [
+    "1. 📂 List Data Files",
+    "2. 🗑️  Clean Old Data",
+    "3. 🔍 Search Data",
+    "4. ⬅️  Back to Main Menu",
+])
+
 
 class WebScrapingCLI:
     def __init__(self):
@@ -36,20 +101,9 @@ class WebScrapingCLI:
     def main_menu(self):
         """Main interactive menu"""
         while True:
-            print("\n" + "=" * 50)
-            print("🌐 WEB SCRAPING CLI INTERFACE")
-            print("=" * 50)
-            print("1. 🚀 Start Scraping")
-            print("2. ⚙️  Configure Settings")
-            print("3. 📊 View Reports & Analytics")
-            print("4. 📁 Run tests")
-            print("5. 📁 Manage Data")
-            print("6. 🔧 System Status")
-            print("7. 📋 View Tasks")
-            print("8. ❌ Exit")
-            print("=" * 50)
-
-            choice = input("Select an option (1-8): ").strip()
+            print(MAIN_MENU)
+
+            choice = read_menu_choice("Select an option (1-8): ")
 
             if choice == '1':
                 self.start_scraping_menu()
@@ -58,7 +112,10 @@ class WebScrapingCLI:
             elif choice == '3':
                 self.view_reports_menu()
             elif choice == '4':
-                self.commands.run_all_tests()
+                # A failing test run ends the CLI with the suite's exit code
+                returncode = self.commands.run_all_tests()
+                if returncode:
+                    sys.exit(returncode)
             elif choice == '5':
                 self.manage_data_menu()
             elif choice == '6':
@@ -71,19 +128,23 @@ class WebScrapingCLI:
             else:
                 print("❌ Invalid option. Please try again.")
 
+    def run_script(self, script_path):
+        """Drive the menus from a file of inputs, one per line, e.g. for profiling"""
+        # Piped input is not a terminal, so every prompt falls back to input()
+        with open(script_path) as script:
+            sys.stdin = script
+            try:
+                self.main_menu()
+            except EOFError:
+                print("\n📜 End of script reached.")
+            finally:
+                sys.stdin = sys.__stdin__
+
     def start_scraping_menu(self):
         """Menu for starting scraping operations"""
-        print("\n" + "=" * 40)
-        print("🚀 START SCRAPING")
-        print("=" * 40)
-        print("1. 🔄 Run All Tasks")
-        print("2. 📰 News Only")
-        print("3. 📻 RSS Only")
-        print("4. 📝 Blog Only")
-        print("5. 🎯 Custom Selection")
-        print("6. ⬅️  Back to Main Menu")
-
-        choice = input("Select scraping type (1-6): ").strip()
+        print(START_SCRAPING_MENU)
+
+        choice = read_menu_choice("Select scraping type (1-6): ")
 
         if choice == '1':
             self.commands.run_all_tasks()
@@ -102,14 +163,9 @@ class WebScrapingCLI:
 
     def configure_settings(self):
         """Configure scraping settings"""
-        print("\n" + "=" * 40)
-        print("⚙️  CONFIGURE SETTINGS")
-        print("=" * 40)
-        print("1. 📝 Edit Tasks")
-        print("2. 🔧 Worker Settings")
-        print("3. ⬅️  Back to Main Menu")
+        print(CONFIGURE_SETTINGS_MENU)
 
-        choice = input("Select option (1-3): ").strip()
+        choice = read_menu_choice("Select option (1-3): ")
 
         if choice == '1':
             self.commands.edit_tasks()
@@ -122,16 +178,9 @@ class WebScrapingCLI:
 
     def view_reports_menu(self):
         """Menu for viewing reports and analytics"""
-        print("\n" + "=" * 40)
-        print("📊 REPORTS & ANALYTICS")
-        print("=" * 40)
-        print("1. 📈 Data Overview")
-        print("2. 📊 Performance Analytics")
-        print("3. 📋 Task Summary")
-        print("4. 📄 Generate HTML Report")
-        print("5. ⬅️  Back to Main Menu")
+        print(REPORTS_MENU)
 
-        choice = input("Select option (1-5): ").strip()
+        choice = read_menu_choice("Select option (1-5): ")
 
         if choice == '1':
             self.commands.data_overview()
@@ -148,15 +197,9 @@ class WebScrapingCLI:
 
     def manage_data_menu(self):
         """Menu for managing data"""
-        print("\n" + "=" * 40)
-        print("📁 MANAGE DATA")
-        print("=" * 40)
-        print("1. 📂 List Data Files")
-        print("2. 🗑️  Clean Old Data")
-        print("3. 🔍 Search Data")
-        print("4. ⬅️  Back to Main Menu")
+        print(MANAGE_DATA_MENU)
 
-        choice = input("Select option (1-4): ").strip()
+        choice = read_menu_choice("Select option (1-4): ")
 
         if choice == '1':
             self.commands.list_data_files()
@@ -177,6 +220,7 @@ def main():
     parser.add_argument('--auto', action='store_true', help='Run all tasks automatically')
     parser.add_argument('--type', choices=['news', 'rss', 'blog'], help='Run specific type only')
     parser.add_argument('--report', action='store_true', help='Generate HTML report')
+    parser.add_argument('--script', metavar='PATH', help='Read menu input from a file instead of the terminal')
 
     args = parser.parse_args()
 
@@ -198,6 +242,8 @@ def main():
     elif args.report:
         print("📄 Generating HTML report...")
         cli.commands.generate_html_report()
+    elif args.script:
+        cli.run_script(args.script)
     else:
         # Interactive mode
         cli.main_menu()
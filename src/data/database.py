@@ -5,10 +5,44 @@ Simple database manager for converting combined.csv to SQLite.
 import sqlite3
 import csv
 import os
+import threading
+from collections import Counter
+from operator import itemgetter
 from datetime import datetime
 from typing import List, Dict, Any
 
 
+# Secondary indexes on articles, by name
+ARTICLE_INDEXES = {
+    'idx_articles_source': 'CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source)',
+    'idx_articles_source_type': 'CREATE INDEX IF NOT EXISTS idx_articles_source_type ON articles(source_type)',
+    # Covers the grouping in get_stats, so it never reads the table itself
+    'idx_articles_source_type_source':
+        'CREATE INDEX IF NOT EXISTS idx_articles_source_type_source ON articles(source_type, source)',
+}
+
+# CSV columns stored as-is, in INSERT_ARTICLE_SQL order ahead of worker_id and task_id
+ARTICLE_TEXT_FIELDS = (
+    'title', 'url', 'author', 'publication_date_datetime',
+    'publication_date_readable', 'summary', 'tags',
+    'source_type', 'source', 'scraped_at', 'metadata',
+)
+
+INSERT_ARTICLE_SQL = '''
+    INSERT OR IGNORE INTO articles (
+        title, url, author, publication_date_datetime,
+        publication_date_readable, summary, tags,
+        source_type, source, scraped_at, metadata,
+        worker_id, task_id
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+def _as_int(value):
+    """Integer from a CSV id cell such as '3' or '3.0'; empty or missing cells are 0."""
+    return int(float(value)) if value else 0
+
+
 class Database:
     """Converts combined.csv to SQLite database."""
     
@@ -16,26 +50,31 @@ class Database:
         """Initialize converter with CSV and database paths."""
         self.csv_path = csv_path
         self.db_path = db_path
-        self.connection = None
+        # sqlite3 connections belong to the thread that opened them
+        self._tls = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
     
     def _get_connection(self):
-        """Get database connection."""
-        if self.connection is None:
-            self.connection = sqlite3.connect(self.db_path)
-            self.connection.row_factory = sqlite3.Row
-        return self.connection
+        """Get this thread's database connection."""
+        conn = getattr(self._tls, 'conn', None)
+        if conn is None:
+            # close() may run on another thread, so the connection has to allow that
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            self._tls.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
     
     def close(self):
-        """Close database connection."""
-        try:
-            if self.connection:
-                self.connection.close()
-                self.connection = None
-        except Exception as e:
-            # Handle threading-related errors gracefully
-            # This can happen when the connection was created in a different thread
-            print(f"Warning: Could not close database connection: {e}")
-            self.connection = None
+        """Close every connection opened through this Database."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+            # Threads that still hold a closed connection open a new one next time
+            self._tls = threading.local()
+        for conn in connections:
+            conn.close()
     
     def create_table(self):
         """Create the articles table based on CSV structure."""
@@ -62,10 +101,14 @@ class Database:
                 )
             ''')
             
+            # Bookkeeping for convert_csv_to_sqlite, e.g. which CSV was last loaded
+            cursor.execute('CREATE TABLE IF NOT EXISTS _meta (k TEXT PRIMARY KEY, v TEXT)')
+            
+            # url lookups use the UNIQUE constraint's own index; an extra url index only slows inserts
+            cursor.execute('DROP INDEX IF EXISTS idx_articles_url')
             # Create indexes for better performance
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_url ON articles(url)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_articles_source_type ON articles(source_type)')
+            for create_index in ARTICLE_INDEXES.values():
+                cursor.execute(create_index)
             
             conn.commit()
             print(f"Table 'articles' created successfully in {self.db_path}")
@@ -82,46 +125,45 @@ class Database:
         converted_count = 0
         
         try:
+            # Skip the load when this exact CSV was already converted
+            st = os.stat(self.csv_path)
+            csv_signature = f"{os.path.abspath(self.csv_path)}:{st.st_mtime_ns}:{st.st_size}"
+            meta = dict(self._get_connection().execute('SELECT k, v FROM _meta').fetchall())
+            if meta.get('csv_signature') == csv_signature:
+                converted_count = int(meta['csv_rows'])
+                print(f"{self.csv_path} is unchanged since the last conversion ({converted_count} rows)")
+                return converted_count
+            
             with open(self.csv_path, 'r', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                
-                with self._get_connection() as conn:
-                    cursor = conn.cursor()
-                    
-                    for row in reader:
-                        try:
-                            # Insert row into database
-                            cursor.execute('''
-                                INSERT OR IGNORE INTO articles (
-                                    title, url, author, publication_date_datetime,
-                                    publication_date_readable, summary, tags,
-                                    source_type, source, scraped_at, metadata,
-                                    worker_id, task_id
-                                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                            ''', (
-                                row.get('title'),
-                                row.get('url'),
-                                row.get('author'),
-                                row.get('publication_date_datetime'),
-                                row.get('publication_date_readable'),
-                                row.get('summary'),
-                                row.get('tags'),
-                                row.get('source_type'),
-                                row.get('source'),
-                                row.get('scraped_at'),
-                                row.get('metadata'),
-                                int(float(row.get('worker_id', 0))) if row.get('worker_id') else 0,
-                                int(float(row.get('task_id', 0))) if row.get('task_id') else 0
-                            ))
-                            
-                            converted_count += 1
-                            
-                        except Exception as e:
-                            print(f"Error converting row: {e}")
-                            print(f"Problematic row: {row}")
-                            continue
-                    
-                    conn.commit()
+                errors = []
+                rows = list(self._article_rows(csv.reader(csvfile), errors))
+            
+            # One summary instead of two prints per bad row
+            if errors:
+                print(f"Error converting {len(errors)} rows:")
+                for line_num, error in errors[:5]:
+                    print(f"  line {line_num}: {error}")
+                if len(errors) > 5:
+                    print(f"  ... and {len(errors) - 5} more")
+            
+            # One executemany in one transaction instead of a Python-level execute per row
+            with self._get_connection() as conn:
+                # sqlite3 only opens its implicit transaction before DML; begin
+                # explicitly so a failed load also rolls back the index drops
+                conn.execute('BEGIN')
+                # Into an empty table, building the secondary indexes once afterwards is
+                # cheaper than updating them per row; UNIQUE(url) still dedups the load
+                fresh_load = conn.execute('SELECT 1 FROM articles LIMIT 1').fetchone() is None
+                if fresh_load:
+                    for name in ARTICLE_INDEXES:
+                        conn.execute(f'DROP INDEX IF EXISTS {name}')
+                conn.executemany(INSERT_ARTICLE_SQL, rows)
+                if fresh_load:
+                    for create_index in ARTICLE_INDEXES.values():
+                        conn.execute(create_index)
+                converted_count = len(rows)
+                conn.executemany('INSERT OR REPLACE INTO _meta (k, v) VALUES (?, ?)',
+                                 [('csv_signature', csv_signature), ('csv_rows', str(converted_count))])
             
             print(f"Successfully converted {converted_count} rows from CSV to SQLite")
             return converted_count
@@ -130,33 +172,56 @@ class Database:
             print(f"Error during CSV conversion: {e}")
             return 0
     
+    @staticmethod
+    def _article_rows(reader, errors):
+        """Yield an INSERT_ARTICLE_SQL parameter tuple per CSV row.
+        
+        Rows that fail to convert are skipped and recorded in ``errors`` as
+        ``(line_num, message)``.
+        """
+        header = next(reader, [])
+        # Columns missing from the header read as None, like DictReader's restval
+        width = len(header)
+
+        def position(name):
+            return header.index(name) if name in header else width
+
+        text_fields = itemgetter(*map(position, ARTICLE_TEXT_FIELDS))
+        worker_id, task_id = position('worker_id'), position('task_id')
+        padding = [None] * (width + 1)
+        for row in reader:
+            # Blank lines come back as []; DictReader skipped them too
+            if not row:
+                continue
+            try:
+                # Drop extra cells and pad short rows so the missing-column slot is always None
+                del row[width:]
+                row += padding[len(row):]
+                yield (*text_fields(row), _as_int(row[worker_id]), _as_int(row[task_id]))
+            except Exception as e:
+                errors.append((reader.line_num, str(e)))
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get basic statistics about the converted data."""
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Total articles
-                cursor.execute('SELECT COUNT(*) FROM articles')
-                total_articles = cursor.fetchone()[0]
-                
-                # Articles by source type
+                # One grouped scan; the totals per type and per source are summed from it
                 cursor.execute('''
-                    SELECT source_type, COUNT(*) as count 
-                    FROM articles 
-                    GROUP BY source_type
+                    SELECT source_type, source, COUNT(*) as count
+                    FROM articles
+                    GROUP BY source_type, source
                 ''')
-                source_type_stats = dict(cursor.fetchall())
+                source_type_counts = Counter()
+                source_counts = Counter()
+                for source_type, source, count in cursor.fetchall():
+                    source_type_counts[source_type] += count
+                    source_counts[source] += count
                 
-                # Articles by source
-                cursor.execute('''
-                    SELECT source, COUNT(*) as count 
-                    FROM articles 
-                    GROUP BY source 
-                    ORDER BY count DESC 
-                    LIMIT 10
-                ''')
-                source_stats = dict(cursor.fetchall())
+                total_articles = sum(source_type_counts.values())
+                source_type_stats = dict(source_type_counts)
+                source_stats = dict(source_counts.most_common(10))
                 
                 return {
                     'total_articles': total_articles,
@@ -171,11 +236,11 @@ class Database:
         """Export data from SQLite back to CSV for verification."""
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('SELECT * FROM articles')
-                rows = cursor.fetchall()
+                cursor = conn.execute('SELECT * FROM articles')
+                # Rows are streamed from the cursor instead of loading the table into memory
+                first_row = cursor.fetchone()
                 
-                if not rows:
+                if first_row is None:
                     print("No data to export")
                     return False
                 
@@ -185,7 +250,8 @@ class Database:
                 with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
                     writer = csv.writer(csvfile)
                     writer.writerow(columns)
-                    writer.writerows(rows)
+                    writer.writerow(first_row)
+                    writer.writerows(cursor)
                 
                 print(f"Data exported to {output_path}")
                 return True
@@ -5,8 +5,30 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 import json
+import sys
 
-@dataclass
+# datetime.fromisoformat accepts a trailing 'Z' from Python 3.11 on
+if sys.version_info >= (3, 11):
+    _parse_iso = datetime.fromisoformat
+else:
+    def _parse_iso(value):
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def parse_datetime(value):
+    """Parse an ISO date string; invalid strings become None, anything else is returned as-is."""
+    if not isinstance(value, str):
+        return value
+    try:
+        return _parse_iso(value)
+    except ValueError:
+        return None
+
+
+# dataclass(slots=True) needs Python 3.10; slotted instances skip the per-object __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class Article:
     """Data model for a scraped article."""
     
@@ -41,21 +63,8 @@ class Article:
             self.tags = [self.tags] if self.tags else []
         
         # Convert datetime strings to datetime objects
-        if isinstance(self.publication_date_datetime, str):
-            try:
-                self.publication_date_datetime = datetime.fromisoformat(
-                    self.publication_date_datetime.replace('Z', '+00:00')
-                )
-            except ValueError:
-                self.publication_date_datetime = None
-        
-        if isinstance(self.scraped_at, str):
-            try:
-                self.scraped_at = datetime.fromisoformat(
-                    self.scraped_at.replace('Z', '+00:00')
-                )
-            except ValueError:
-                self.scraped_at = None
+        self.publication_date_datetime = parse_datetime(self.publication_date_datetime)
+        self.scraped_at = parse_datetime(self.scraped_at)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert article to dictionary."""
@@ -78,7 +87,7 @@ class Article:
         """Create article from dictionary."""
         return cls(**data)
 
-@dataclass
+@dataclass(**_SLOTS)
 class ScrapingResult:
     """Result of a scraping operation."""
     
@@ -104,7 +113,7 @@ class ScrapingResult:
         return len(self.errors)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ScrapingTask:
     """Represents a scraping task."""
     
@@ -122,7 +131,7 @@ class ScrapingTask:
             self.id = str(uuid.uuid4())
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ScrapingStats:
     """Statistics for scraping operations."""
     
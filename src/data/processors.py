@@ -5,11 +5,107 @@ Data processing utilities for handling data output operations.
 import os
 import json
 import csv
-import pandas as pd
-from datetime import datetime, timedelta
+import fnmatch
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 from src.utils.logger import log
+from src.utils import jsonio
+
+# JSON files whose item counts the CLI reads from a .count sidecar
+COUNTED_FILE_SUFFIX = '_data.json'
+
+# Bytes read from the end of a JSON file to find its closing bracket
+JSON_TAIL_BYTES = 4096
+# Suffix of the copy an append is written to before it replaces the file
+TEMP_SUFFIX = '.tmp'
+
+
+def _append_to_json_array(filepath, data) -> bool:
+    """Write data into the JSON array at filepath without re-parsing the file.
+
+    The new items go into a copy of the file that then replaces it, so an
+    interrupted append leaves the previous array in place. Returns False when
+    the file is missing or does not look like an array, so the caller falls
+    back to rewriting it.
+    """
+    try:
+        f = open(filepath, 'rb')
+    except FileNotFoundError:
+        return False
+    with f:
+        if f.read(1) != b'[':
+            return False
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(size - JSON_TAIL_BYTES, 0))
+        tail = f.read().rstrip()
+    if not tail.endswith(b']'):
+        return False
+    if not data:
+        return True
+    count = jsonio.read_count(filepath)
+    # Keep whatever precedes the bracket, minus the whitespace before it
+    head = tail[:-1].rstrip()
+    end = size - len(tail) + len(head)
+    # The indented dump is '[' + items + '\n]'; only the items are written
+    items = jsonio.dumps(data, indent=True)[1:-2]
+    temp_path = f"{filepath}{TEMP_SUFFIX}"
+    try:
+        # A byte copy (done in the kernel where supported), not a parse
+        shutil.copyfile(filepath, temp_path)
+        with open(temp_path, 'r+b') as temp:
+            temp.seek(end)
+            temp.truncate()
+            temp.write((items if head.endswith(b'[') else b',' + items) + b'\n]')
+            temp.flush()
+            os.fsync(temp.fileno())
+        os.replace(temp_path, filepath)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    if count is not None:
+        jsonio.write_count(filepath, count + len(data))
+    return True
+
+
+# Suffix of the sidecar that lists the URLs already written to a CSV file
+URLS_SUFFIX = '.urls'
+
+
+def _read_url_sidecar(filepath, size):
+    """URLs recorded for the CSV at filepath, or None if missing or not for a CSV of this size.
+
+    The sidecar holds one URL per line and ends with a '#<csv size>' line.
+    """
+    try:
+        with open(f"{filepath}{URLS_SUFFIX}", encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return None
+    if not lines or lines[-1] != f"#{size}":
+        return None
+    # Earlier '#' lines mark previous appends
+    return {line for line in lines[:-1] if line and not line.startswith('#')}
+
+
+def _write_url_sidecar(filepath, urls, size, append: bool) -> None:
+    """Record urls for the CSV at filepath, which is now size bytes long."""
+    with open(f"{filepath}{URLS_SUFFIX}", 'a' if append else 'w', encoding='utf-8') as f:
+        f.writelines(f"{url}\n" for url in urls)
+        f.write(f"#{size}\n")
+
+
+def _url_key(item):
+    """The item's url as a sidecar line, or None when it cannot be deduplicated on."""
+    url = item.get('url')
+    if not isinstance(url, str) or not url or '\n' in url or url.startswith('#'):
+        return None
+    return url
+
 
 class DataOutputManager:
     """Manages data output operations with append functionality."""
@@ -18,18 +114,24 @@ class DataOutputManager:
         """Initialize the data output manager."""
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        # CSV path -> (size, URLs in it), so save_combined_csv skips the sidecar while the CSV is unchanged
+        self._seen_urls = {}
     
     def append_to_json(self, filename: str, data: List[Dict[str, Any]]) -> bool:
         """Append data to a JSON file, creating it if it doesn't exist."""
         try:
             filepath = self.output_dir / filename
             
+            # Splice new items in before the closing bracket of an existing array
+            if _append_to_json_array(filepath, data):
+                return True
+            
             # Load existing data if file exists
             existing_data = []
             if filepath.exists():
                 try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        existing_data = json.load(f)
+                    with open(filepath, 'rb') as f:
+                        existing_data = jsonio.loads(f.read())
                 except (json.JSONDecodeError, FileNotFoundError):
                     existing_data = []
             
@@ -40,8 +142,12 @@ class DataOutputManager:
                 existing_data = [existing_data] + data
             
             # Write back to file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(existing_data, f, indent=2, ensure_ascii=False)
+            with open(filepath, 'wb') as f:
+                f.write(jsonio.dumps(existing_data, indent=True))
+            # Let the CLI, which only needs the length, skip parsing the file;
+            # short-lived worker files get no sidecar to clean up
+            if filename.endswith(COUNTED_FILE_SUFFIX):
+                jsonio.write_count(filepath, len(existing_data))
             
             return True
         except Exception as e:
@@ -53,33 +159,64 @@ class DataOutputManager:
         try:
             filepath = self.output_dir / filename
             
-            # Check if file exists to determine if we need to write headers
-            file_exists = filepath.exists()
-            
             # Get fieldnames from data
             if data:
-                fieldnames = list(data[0].keys())
+                fieldnames = list(dict.fromkeys(key for row in data for key in row))
             else:
                 return True  # No data to append
             
+            # An existing file keeps its own column order
+            header = None
+            if filepath.exists():
+                with open(filepath, newline='', encoding='utf-8') as f:
+                    header = next(csv.reader(f), None)
+            
+            if header is None:
+                rows, mode = data, 'w'
+            elif set(fieldnames) <= set(header):
+                rows, mode = data, 'a'
+            else:
+                # New columns: rewrite the file under the widened header
+                with open(filepath, newline='', encoding='utf-8') as f:
+                    rows = list(csv.DictReader(f))
+                rows.extend(data)
+                header = header + [key for key in fieldnames if key not in header]
+                mode = 'w'
+            
             # Append data to CSV
-            mode = 'a' if file_exists else 'w'
             with open(filepath, mode, newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer = csv.DictWriter(f, fieldnames=header or fieldnames)
                 
                 # Write header only if file is new
-                if not file_exists:
+                if mode == 'w':
                     writer.writeheader()
                 
                 # Write data
-                for row in data:
-                    writer.writerow(row)
+                writer.writerows(rows)
             
             return True
         except Exception as e:
             log.info(f"Error appending to CSV {filename}: {e}")
             return False
     
+    def _load_seen_urls(self, filepath) -> set:
+        """URLs already in the CSV at filepath, read from memory, its sidecar, or the CSV itself."""
+        try:
+            size = os.stat(filepath).st_size
+        except FileNotFoundError:
+            return set()
+        cached = self._seen_urls.get(filepath)
+        if cached is not None and cached[0] == size:
+            return cached[1]
+        seen = _read_url_sidecar(filepath, size)
+        if seen is None:
+            # Missing or stale sidecar: rebuild it from the url column once
+            with open(filepath, newline='', encoding='utf-8') as f:
+                seen = {url for url in map(_url_key, csv.DictReader(f)) if url is not None}
+            _write_url_sidecar(filepath, seen, size, append=False)
+        self._seen_urls[filepath] = (size, seen)
+        return seen
+    
     def save_combined_csv(self, data_by_type: Dict[str, List[Dict[str, Any]]], filename: str = "combined.csv") -> bool:
         """Save combined data from multiple sources to CSV with append functionality."""
         try:
@@ -98,35 +235,33 @@ class DataOutputManager:
                 log.warning("No items to save to combined CSV")
                 return True
             
-            # Use pandas for better CSV handling
-            try:
-                df_new = pd.DataFrame(all_items)
-                filepath = self.output_dir / filename
-                
-                if filepath.exists():
-                    # Read existing data and append
-                    df_existing = pd.read_csv(filepath)
-                    log.info(f"Existing CSV has {len(df_existing)} records")
-                    df_combined = pd.concat([df_existing, df_new], ignore_index=True)
-                    log.info(f"After concatenation: {len(df_combined)} records")
-                    # Remove duplicates based on URL if it exists
-                    if 'url' in df_combined.columns:
-                        before_dedup = len(df_combined)
-                        df_combined = df_combined.drop_duplicates(subset=['url'], keep='last')
-                        after_dedup = len(df_combined)
-                        log.info(f"Removed {before_dedup - after_dedup} duplicate URLs")
-                else:
-                    df_combined = df_new
-                    log.info(f"Creating new CSV with {len(df_combined)} records")
-                
-                df_combined.to_csv(filepath, index=False)
-                log.info(f"Successfully saved {len(df_combined)} records to {filename}")
+            # Only rows whose URL is not in the file yet are appended
+            filepath = self.output_dir / filename
+            existed = filepath.exists()
+            seen = self._load_seen_urls(filepath)
+            new_rows = []
+            new_urls = []
+            for item in all_items:
+                url = _url_key(item)
+                if url is not None:
+                    if url in seen:
+                        continue
+                    seen.add(url)
+                    new_urls.append(url)
+                new_rows.append(item)
+            log.info(f"Skipped {len(all_items) - len(new_rows)} duplicate URLs")
+            
+            if not new_rows:
                 return True
-                
-            except ImportError:
-                # Fallback to CSV writer if pandas is not available
-                log.warning("Pandas not available, using fallback CSV writer")
-                return self.append_to_csv(filename, all_items)
+            if not self.append_to_csv(filename, new_rows):
+                seen.difference_update(new_urls)
+                return False
+            
+            size = os.stat(filepath).st_size
+            _write_url_sidecar(filepath, new_urls, size, append=existed)
+            self._seen_urls[filepath] = (size, seen)
+            log.info(f"Successfully saved {len(new_rows)} records to {filename}")
+            return True
                 
         except Exception as e:
             log.error(f"Error saving combined CSV: {e}")
@@ -137,7 +272,8 @@ class DataOutputManager:
         try:
             filepath = self.output_dir/  filename
             
-            # Prepare summary data
+            # Prepare summary data; one timestamp covers the whole batch
+            timestamp = datetime.now().isoformat()
             summary_data = []
             for result in results:
                 summary_data.append({
@@ -148,7 +284,7 @@ class DataOutputManager:
                     'processing_time': round(result.processing_time, 2),
                     'data_count': len(result.data) if result.data else 0,
                     'error_message': result.error_message if hasattr(result, 'error_message') else None,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': timestamp
                 })
             
             return self.append_to_csv(filename, summary_data)
@@ -170,23 +306,19 @@ class DataOutputManager:
     def cleanup_old_files(self, max_age_hours: int = 24, pattern: str = "worker_*.json") -> None:
         """Clean up old files in the output directory."""
         try:
-            import glob
+            cutoff_time = time.time() - max_age_hours * 3600
             
-            cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
-            
-            # Get all files matching pattern
-            file_pattern = self.output_dir / pattern
-            files = glob.glob(str(file_pattern))
-            
-            for file_path in files:
-                try:
-                    # Get file modification time
-                    mtime = datetime.fromtimestamp(os.path.getmtime(file_path))
-                    if mtime < cutoff_time:
-                        os.remove(file_path)
-                        log.info(f"Cleaned up old file: {file_path}")
-                except Exception as e:
-                    log.info(f"Failed to clean up file {file_path}: {e}")
+            # One directory pass; entries carry their own stat
+            with os.scandir(self.output_dir) as it:
+                for entry in it:
+                    if not fnmatch.fnmatch(entry.name, pattern):
+                        continue
+                    try:
+                        if entry.stat().st_mtime < cutoff_time:
+                            os.remove(entry.path)
+                            log.info(f"Cleaned up old file: {entry.path}")
+                    except Exception as e:
+                        log.info(f"Failed to clean up file {entry.path}: {e}")
                     
         except Exception as e:
             log.info(f"Error during cleanup: {e}")
@@ -198,6 +330,11 @@ class DataOutputManager:
 # Global instance for easy access
 data_output_manager = DataOutputManager()
 
+def _read_json_file(file_path):
+    """Parse the JSON file at file_path."""
+    with open(file_path, 'rb') as f:
+        return jsonio.loads(f.read())
+
 def consolidate_worker_data(output_dir: str = "data_output/raw") -> Dict[str, List[Dict[str, Any]]]:
     """
     Consolidate all worker JSON files by source type.
@@ -220,10 +357,12 @@ def consolidate_worker_data(output_dir: str = "data_output/raw") -> Dict[str, Li
     log.info(f"Found {len(worker_files)} worker files to consolidate")
     
     if worker_files:
-        for file_path in worker_files:
+        # Overlap the file reads on threads; items are still grouped in file order
+        with ThreadPoolExecutor(max_workers=min(32, len(worker_files))) as executor:
+            futures = [executor.submit(_read_json_file, file_path) for file_path in worker_files]
+        for file_path, future in zip(worker_files, futures):
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = future.result()
                     
                 if not isinstance(data, list):
                     data = [data]
@@ -256,8 +395,8 @@ def consolidate_worker_data(output_dir: str = "data_output/raw") -> Dict[str, Li
             type_file = output_path / f"{data_type}_data.json"
             if type_file.exists():
                 try:
-                    with open(type_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    with open(type_file, 'rb') as f:
+                        data = jsonio.loads(f.read())
                     if isinstance(data, list):
                         consolidated_data[data_type] = data
                         log.info(f"Loaded {len(data)} items from {type_file}")
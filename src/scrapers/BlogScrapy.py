@@ -2,10 +2,15 @@ import subprocess
 import json
 import os
 from src.utils.logger import log
+from src.utils import jsonio
 from src.scrapers.ScraperFactory import Scraper
-from src.data.models import Article
+from src.data.models import Article, parse_datetime
 from typing import List, Dict, Any
 from datetime import datetime
+import re
+
+# Whitespace between concatenated JSON arrays in Scrapy output
+_WHITESPACE = re.compile(r'\s*')
 
 class BlogScrapy(Scraper):
     def __init__(self):
@@ -51,10 +56,11 @@ class BlogScrapy(Scraper):
                 articles = self.preprocess_data(raw_data)
                 
                 # Add source type metadata
+                now = datetime.now()
                 for article in articles:
                     article.source_type = 'blog'
                     if not article.scraped_at:
-                        article.scraped_at = datetime.now()
+                        article.scraped_at = now
                 
                 log.info(f"Successfully scraped {len(articles)} blog articles")
                 return articles
@@ -72,36 +78,25 @@ class BlogScrapy(Scraper):
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read().strip()
             
-            # Handle the case where multiple JSON arrays are concatenated with ][
-            if '][' in content:
-                # Split by ][ and fix the JSON structure
-                parts = content.split('][')
-                all_data = []
-                
-                for i, part in enumerate(parts):
-                    # Remove leading [ and trailing ] if they exist
-                    if part.startswith('['):
-                        part = part[1:]
-                    if part.endswith(']'):
-                        part = part[:-1]
-                    
-                    # Skip empty parts
-                    if not part.strip():
-                        continue
-                    
-                    try:
-                        # Parse each part as JSON
-                        if part.strip():
-                            data = json.loads(f"[{part}]")
-                            all_data.extend(data)
-                    except json.JSONDecodeError as e:
-                        log.warning(f"Failed to parse JSON part {i}: {e}")
-                        continue
-                
-                return all_data
-            else:
+            try:
                 # Normal JSON parsing
-                return json.loads(content)
+                return jsonio.loads(content)
+            except json.JSONDecodeError:
+                pass
+            
+            # Appended runs leave several arrays back to back ('[...][...]');
+            # decode them in turn from the one string instead of splitting it
+            all_data = []
+            decoder = json.JSONDecoder()
+            pos = 0
+            while pos < len(content):
+                data, pos = decoder.raw_decode(content, pos)
+                if isinstance(data, list):
+                    all_data.extend(data)
+                else:
+                    all_data.append(data)
+                pos = _WHITESPACE.match(content, pos).end()
+            return all_data
                 
         except json.JSONDecodeError as e:
             log.error(f"Failed to parse JSON from Scrapy output: {str(e)}")
@@ -123,7 +118,7 @@ class BlogScrapy(Scraper):
                         if line.endswith(','):
                             line = line[:-1]
                         try:
-                            item = json.loads(line)
+                            item = jsonio.loads(line)
                             data.append(item)
                         except json.JSONDecodeError:
                             continue
@@ -155,20 +150,28 @@ class BlogScrapy(Scraper):
         #                         'framework': 'basicScraper/bs4'
         #                     }
         #                 )
+        # Listings repeat the same dates, so each distinct string is parsed once
+        dates = {}
+        now = datetime.now()
         for item in raw_data:
             try:
+                date = item.get('publication_date_datetime')
+                if isinstance(date, str):
+                    if date not in dates:
+                        dates[date] = parse_datetime(date)
+                    date = dates[date]
                 # Create Article object from raw data
                 article = Article(
                     title=item.get('title'),
                     url=item.get('url'),
                     author=item.get('author'),
-                    publication_date_datetime=item.get('publication_date_datetime'),
+                    publication_date_datetime=date,
                     publication_date_readable=item.get('publication_date_readable'),
                     summary=item.get('summary'),
                     tags=item.get('tags', []),
                     source_type='blog',
                     source='TechCrunch',
-                    scraped_at=datetime.now(),
+                    scraped_at=now,
                     metadata={
                         'scraper': 'BlogScrapy',
                         'spider': 'techcrunch'
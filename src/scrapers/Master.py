@@ -1,7 +1,8 @@
 import csv
 import os
 import time
-from multiprocessing import Queue, Process, Manager
+from multiprocessing import Queue, Process
+from queue import Empty
 from threading import Thread
 import glob
 
@@ -14,10 +15,12 @@ import json
 
 # create master
 class Master:
-    def __init__(self, task_queue=None, result_queue=None, worker_status=None, n=3):
+    def __init__(self, task_queue=None, result_queue=None, status_queue=None, n=3):
         self.task_queue = task_queue if task_queue is not None else Queue()
         self.result_queue = result_queue if result_queue is not None else Queue()
-        self.worker_status = worker_status if worker_status is not None else Manager().dict()
+        # workers push (worker_id, state) events; the master folds them into a local dict
+        self.status_queue = status_queue if status_queue is not None else Queue()
+        self.worker_status = {}
         
         # Initialize database manager
         self.db_manager = Database()
@@ -50,16 +53,18 @@ class Master:
             self.db_manager.close()
 
     def add_tasks(self, tasks):
-        for task in tasks:
+        # tasks can be any iterable, so callers may stream them straight from the config
+        added = 0
+        for added, task in enumerate(tasks, 1):
             self.task_queue.put(task)
-            self.number_of_Tasks += 1
-        log.info(f"Added {len(tasks)} tasks")
+        self.number_of_Tasks += added
+        log.info(f"Added {added} tasks")
 
     def start_workers(self):
         #Start all worker processes
         log.info("Starting workers")
         for i in range(self.workers):
-            worker = Worker(i, self.task_queue, self.result_queue, self.stop,self.worker_status)
+            worker = Worker(i, self.task_queue, self.result_queue, self.stop, self.status_queue)
             process = Process(target=worker.run)
             self.worker_list.append(process)
             process.start()
@@ -78,6 +83,15 @@ class Master:
             if worker.is_alive():
                 worker.terminate()
 
+    def drain_status(self):
+        #Apply pending worker status events to worker_status
+        while True:
+            try:
+                wid, status = self.status_queue.get_nowait()
+            except Empty:
+                break
+            self.worker_status[wid] = status
+
     def save_summary_to_csv(self,path = "summary"):
         log.info("Saving summary to csv")
         total = len(self.results)
@@ -220,6 +234,7 @@ class Master:
 
             print(successful_tasks)
             print(failed_tasks)
+            self.drain_status()
             for wid, status in self.worker_status.items():
                 print(f"Worker {wid} status: {status}")
             time.sleep(4)
@@ -35,10 +35,11 @@ class NewsScraper(Scraper):
             articles = self.preprocess_data(raw_data)
             
             # Add source type metadata
+            now = datetime.now()
             for article in articles:
                 article.source_type = 'news'
                 if not article.scraped_at:
-                    article.scraped_at = datetime.now()
+                    article.scraped_at = now
             
             log.info(f"Successfully scraped {len(articles)} news articles from {url}")
             return articles
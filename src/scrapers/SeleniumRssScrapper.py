@@ -144,10 +144,11 @@ class seleniumRssScrapper(Scraper):
             articles = self.preprocess_data(raw_data)
             
             # Add source type metadata
+            now = datetime.now()
             for article in articles:
                 article.source_type = 'rss'
                 if not article.scraped_at:
-                    article.scraped_at = datetime.now()
+                    article.scraped_at = now
                 article.metadata['search_word'] = self.search_word
             
             log.info(f"Successfully scraped {len(articles)} RSS articles")
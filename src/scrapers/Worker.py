@@ -13,12 +13,13 @@ import os
 
 class Worker:
 
-    def __init__(self,name,task_queue,result_queue, stop,worker_status):
+    def __init__(self,name,task_queue,result_queue, stop,status_queue):
         self.name = name
         self.taskQueue = task_queue
         self.resultQueue = result_queue
         self.stop_flag = stop
-        self.worker_status = worker_status
+        self.status_queue = status_queue
+        self.status = None
         self.rate_limiter = RateLimiter(max_requests_per_second=1)
         self.max_retries = 3
         log.info(f'worker {name} was initialized')
@@ -74,6 +75,12 @@ class Worker:
             processing_time=processing_time
         )
 
+    def set_status(self, status):
+        # only report changes, so an idle worker polling the task queue sends nothing
+        if status != self.status:
+            self.status = status
+            self.status_queue.put((self.name, status))
+
     def save_result(self, data):
         log.info(f"saving result")
         # Use data output manager to save worker results
@@ -82,17 +89,17 @@ class Worker:
     def run(self):
         while self.stop_flag == 0:
             try:
-                self.worker_status[self.name] = "idle"
+                self.set_status("idle")
                 task = self.taskQueue.get(timeout=1)
                 if task is None:
                     break
                 log.info(f"Worker {self.name} started task {task.id}")
-                self.worker_status[self.name] = "busy"
+                self.set_status("busy")
                 result = self._process(task)
                 self.save_result(result.data)
                 self.resultQueue.put(result)
-                self.worker_status[self.name] = "idle"
+                self.set_status("idle")
             except Exception as e:
-                self.worker_status[self.name] = "idle"
+                self.set_status("idle")
                 continue
         log.info(f"Worker {self.name} finished")
\ No newline at end of file
@@ -10,9 +10,12 @@ def generate_header():
     proxy = random.choice(proxies)
     return [user_agent, proxy]
 
-def generate_tasks():
-    # get tasks from json
+def generate_tasks(task_type=None):
+    # get tasks from json; for one task type, (config index, task) pairs so the
+    # tasks keep the ids they get in a full run
     with open("config.json", "r") as f:
         config = json.load(f)
 
-    return config["tasks"]
\ No newline at end of file
+    if task_type is None:
+        return config["tasks"]
+    return [(i, task) for i, task in enumerate(config["tasks"]) if task["type"] == task_type]
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""
+JSON helpers that use orjson when it is installed and fall back to the standard library.
+"""
+import json
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj, indent: bool = False, default=None) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes.
+
+    ``indent`` pretty-prints with two spaces. ``default`` is called for
+    objects neither encoder handles natively.
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=default, ensure_ascii=False).encode('utf-8')
+
+
+def loads(data):
+    """Parse JSON from ``bytes`` or ``str``."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Suffix of the sidecar file that records how many items a JSON array file holds
+COUNT_SUFFIX = '.count'
+
+
+def write_count(path, count: int) -> None:
+    """Record that the JSON file at ``path`` holds ``count`` items.
+
+    The sidecar stores the file's mtime and size with the count, so it is
+    ignored once the file changes without it.
+    """
+    st = os.stat(path)
+    with open(f"{path}{COUNT_SUFFIX}", 'wb') as f:
+        f.write(dumps([st.st_mtime_ns, st.st_size, count]))
+
+
+def read_count(path):
+    """Item count recorded by ``write_count``, or None if missing or stale."""
+    try:
+        with open(f"{path}{COUNT_SUFFIX}", 'rb') as f:
+            mtime_ns, size, count = loads(f.read())
+        st = os.stat(path)
+    except (OSError, ValueError, TypeError):
+        return None
+    if (mtime_ns, size) != (st.st_mtime_ns, st.st_size):
+        return None
+    return count
@@ -141,6 +141,65 @@ class TestDataProcessingPipeline(unittest.TestCase):
         # Verify success
         self.assertTrue(success)
 
+    def test_append_to_json_keeps_a_valid_array(self):
+        """Test repeated appends extend the JSON array in place."""
+        from src.data.processors import DataOutputManager
+        from src.utils import jsonio
+
+        manager = DataOutputManager(self.data_dir)
+        self.assertTrue(manager.append_to_json("blog_data.json", SAMPLE_ARTICLES[:1]))
+        self.assertTrue(manager.append_to_json("blog_data.json", SAMPLE_ARTICLES[1:]))
+        self.assertTrue(manager.append_to_json("blog_data.json", []))
+
+        filepath = os.path.join(self.data_dir, "blog_data.json")
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        # Same bytes as writing the whole list at once
+        self.assertEqual(raw, jsonio.dumps(SAMPLE_ARTICLES, indent=True))
+        self.assertEqual(jsonio.read_count(filepath), len(SAMPLE_ARTICLES))
+
+        # Worker files are removed after consolidation, so they get no count sidecar
+        self.assertTrue(manager.save_worker_result("test", SAMPLE_ARTICLES))
+        self.assertEqual([name for name in os.listdir(self.data_dir) if name.endswith(jsonio.COUNT_SUFFIX)],
+                         ["blog_data.json" + jsonio.COUNT_SUFFIX])
+
+    def test_append_to_json_survives_an_interrupted_write(self):
+        """Test an append cut off mid-write leaves the previous array readable."""
+        from src.data.processors import DataOutputManager
+        from src.utils import jsonio
+
+        manager = DataOutputManager(self.data_dir)
+        self.assertTrue(manager.append_to_json("blog_data.json", SAMPLE_ARTICLES[:1]))
+        filepath = os.path.join(self.data_dir, "blog_data.json")
+
+        def torn_fsync(fd):
+            # Leave half of the new file on disk, then fail as a crash would
+            os.ftruncate(fd, os.fstat(fd).st_size // 2)
+            raise OSError("simulated crash")
+
+        with patch('src.data.processors.os.fsync', side_effect=torn_fsync):
+            self.assertFalse(manager.append_to_json("blog_data.json", SAMPLE_ARTICLES[1:]))
+
+        with open(filepath, 'rb') as f:
+            self.assertEqual(jsonio.loads(f.read()), SAMPLE_ARTICLES[:1])
+        self.assertEqual(jsonio.read_count(filepath), 1)
+        self.assertEqual(sorted(os.listdir(self.data_dir)),
+                         ["blog_data.json", "blog_data.json" + jsonio.COUNT_SUFFIX])
+
+    def test_save_combined_csv_skips_saved_urls(self):
+        """Test combined CSV appends only URLs it does not hold yet."""
+        from src.data.processors import DataOutputManager
+
+        manager = DataOutputManager(self.data_dir)
+        self.assertTrue(manager.save_combined_csv({"news": SAMPLE_ARTICLES[:1]}))
+        self.assertTrue(manager.save_combined_csv({"rss": SAMPLE_ARTICLES}))
+        # A fresh manager reads the saved URLs back from disk
+        self.assertTrue(DataOutputManager(self.data_dir).save_combined_csv({"blog": SAMPLE_ARTICLES}))
+
+        df = pd.read_csv(os.path.join(self.data_dir, "combined.csv"))
+        self.assertEqual(list(df['url']), [article['url'] for article in SAMPLE_ARTICLES])
+        self.assertEqual(list(df['source_type']), ['news'] + ['rss'] * (len(SAMPLE_ARTICLES) - 1))
+
     def test_worker_file_cleanup(self):
         """Test worker file cleanup pipeline."""
         # Create test worker files
@@ -197,6 +256,80 @@ class TestDataProcessingPipeline(unittest.TestCase):
         self.assertIn('news', source_counts.index)
         self.assertGreater(len(author_counts), 0)
 
+    def test_trend_aggregates_match_load_data(self):
+        """Test database aggregate mode keeps the same rows as load_data on mixed timestamps."""
+        import sqlite3
+        from src.analysis.trends import TrendAnalysis
+
+        db_path = os.path.join(self.data_dir, "articles.db")
+        rows = [
+            ("A", "s", "TechCrunch", "blog", "2025-06-27T10:05:00-07:00"),
+            ("B", "s", "TechCrunch", "blog", "2025-06-27T13:15:00-07:00"),
+            ("C", "s", "BBC News", "news", "2025-06-27T09:00:00+01:00"),
+            ("D", "s", "Example Blog", "rss", "2025-06-28 12:00:00.938634"),
+            ("E", "s", "Example Blog", "rss", "not a date"),
+        ]
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("CREATE TABLE articles (title, summary, source, source_type, publication_date_datetime)")
+            conn.executemany("INSERT INTO articles VALUES (?, ?, ?, ?, ?)", rows)
+        conn.close()
+
+        cubes = []
+        for load in ("load_data", "load_aggregates_from_db"):
+            trends = TrendAnalysis(data_path=os.path.join(self.data_dir, "missing.csv"), db_path=db_path)
+            self.assertTrue(getattr(trends, load)())
+            cube = trends.aggregate_cube
+            cubes.append(sorted(
+                (source, source_type, day, n, first, last)
+                for (source, source_type, day), n, first, last
+                in zip(cube.index, cube['n'], cube['first_article'], cube['last_article'])
+            ))
+            trends.close_connection()
+
+        self.assertEqual(len(cubes[0]), 3)
+        self.assertEqual(cubes[0], cubes[1])
+
+    def test_keyword_trends_match_unicode_whole_words(self):
+        """Test keyword matching treats accented letters as word characters."""
+        from src.analysis.trends import TrendAnalysis
+
+        csv_path = os.path.join(self.data_dir, "combined.csv")
+        pd.DataFrame({
+            'title': ["Le café est ouvert", "Un café", "Cafés everywhere", "New database release", "Data wins"],
+            'summary': ["", "", "", "", None],
+            'source': ["A", "A", "A", "B", "B"],
+            'source_type': ["news", "news", "news", "blog", "blog"],
+            'publication_date_datetime': ["2025-06-27T10:00:00-07:00"] * 5,
+        }).to_csv(csv_path, index=False)
+
+        trends = TrendAnalysis(data_path=csv_path)
+        self.assertTrue(trends.load_data())
+        result = trends.keyword_trend_analysis(['café', 'data'])
+
+        self.assertEqual(result['café']['total_articles'], 2)
+        self.assertEqual(result['data']['total_articles'], 1)
+
+    def test_csv_to_sqlite_skips_blank_lines(self):
+        """Test blank lines in combined.csv are not stored as empty articles."""
+        from src.data.database import Database
+
+        csv_path = os.path.join(self.data_dir, "combined.csv")
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            f.write("title,url,source_type,worker_id,task_id\n")
+            f.write("First,https://example.com/1,news,1,2\n")
+            f.write("\n")
+            f.write("Second,https://example.com/2,rss,3.0,4\n")
+            f.write("\n")
+
+        db = Database(csv_path=csv_path, db_path=os.path.join(self.data_dir, "articles.db"))
+        try:
+            self.assertEqual(db.convert_csv_to_sqlite(), 2)
+            rows = db._get_connection().execute(
+                "SELECT title, worker_id, task_id FROM articles ORDER BY id").fetchall()
+        finally:
+            db.close()
+        self.assertEqual([tuple(row) for row in rows], [("First", 1, 2), ("Second", 3, 4)])
+
     def test_error_handling_in_data_processing(self):
         """Test error handling in data processing pipeline."""
         # Test with invalid data
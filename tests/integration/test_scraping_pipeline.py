@@ -11,7 +11,7 @@ import sys
 import time
 from pathlib import Path
 from unittest.mock import patch, MagicMock
-from multiprocessing import Queue, Manager
+from multiprocessing import Queue
 import queue
 
 # Add project root and src to path for imports
@@ -113,14 +113,13 @@ class TestScrapingPipeline(unittest.TestCase):
         # Create queues
         task_queue = Queue()
         result_queue = Queue()
-        manager = Manager()
-        worker_status = manager.dict()
+        status_queue = Queue()
         
         # Initialize Master
         master = Master(
             task_queue=task_queue,
             result_queue=result_queue,
-            worker_status=worker_status,
+            status_queue=status_queue,
             n=3
         )
         
@@ -136,8 +135,6 @@ class TestScrapingPipeline(unittest.TestCase):
         """Test task queue operations in the pipeline."""
         task_queue = queue.Queue()
         result_queue = queue.Queue()
-        manager = Manager()
-        worker_status = manager.dict()
         
         # Create tasks
         tasks = []
@@ -168,8 +165,6 @@ class TestScrapingPipeline(unittest.TestCase):
         """Test result queue operations in the pipeline."""
         task_queue = queue.Queue()
         result_queue = queue.Queue()
-        manager = Manager()
-        worker_status = manager.dict()
         
         # Create results
         results = []
@@ -210,13 +205,12 @@ class TestScrapingPipeline(unittest.TestCase):
         # Create Master instance
         task_queue = Queue()
         result_queue = Queue()
-        manager = Manager()
-        worker_status = manager.dict()
+        status_queue = Queue()
         
         master = Master(
             task_queue=task_queue,
             result_queue=result_queue,
-            worker_status=worker_status
+            status_queue=status_queue
         )
         
         # Create tasks
@@ -336,28 +330,32 @@ class TestScrapingPipeline(unittest.TestCase):
         self.assertEqual(len(failed_result.errors), 2)
         self.assertIn("Connection timeout", failed_result.errors)
 
-    def test_worker_status_management(self):
+    @patch('src.scrapers.Master.Database')
+    def test_worker_status_management(self, mock_database_class):
         """Test worker status management in the pipeline."""
-        manager = Manager()
-        worker_status = manager.dict()
+        mock_database_class.return_value = MagicMock()
+        status_queue = queue.Queue()
+        master = Master(task_queue=Queue(), result_queue=Queue(), status_queue=status_queue)
         
         # Simulate worker status updates
-        worker_status["worker_0"] = "running"
-        worker_status["worker_1"] = "idle"
-        worker_status["worker_2"] = "completed"
+        status_queue.put(("worker_0", "running"))
+        status_queue.put(("worker_1", "idle"))
+        status_queue.put(("worker_2", "completed"))
+        master.drain_status()
         
         # Verify worker status
-        self.assertEqual(worker_status["worker_0"], "running")
-        self.assertEqual(worker_status["worker_1"], "idle")
-        self.assertEqual(worker_status["worker_2"], "completed")
+        self.assertEqual(master.worker_status["worker_0"], "running")
+        self.assertEqual(master.worker_status["worker_1"], "idle")
+        self.assertEqual(master.worker_status["worker_2"], "completed")
         
         # Update worker status
-        worker_status["worker_0"] = "completed"
-        worker_status["worker_1"] = "running"
+        status_queue.put(("worker_0", "completed"))
+        status_queue.put(("worker_1", "running"))
+        master.drain_status()
         
         # Verify updated status
-        self.assertEqual(worker_status["worker_0"], "completed")
-        self.assertEqual(worker_status["worker_1"], "running")
+        self.assertEqual(master.worker_status["worker_0"], "completed")
+        self.assertEqual(master.worker_status["worker_1"], "running")
 
     def test_data_export_pipeline(self):
         """Test data export functionality in the pipeline."""
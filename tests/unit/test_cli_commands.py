@@ -18,6 +18,7 @@ sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "src"))
 
 from src.cli.commands import WebScrapingCommands
+from src.utils import jsonio
 from tests.fixtures.test_data import SAMPLE_CONFIG, SAMPLE_ARTICLES
 
 
@@ -42,7 +43,7 @@ class TestWebScrapingCommands(unittest.TestCase):
         import shutil
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
-    @patch('src.cli.commands.Master')
+    @patch('src.scrapers.Master.Master')
     @patch('src.cli.commands.generate_tasks')
     def test_run_all_tasks_success(self, mock_generate_tasks, mock_master_class):
         """Test successful execution of all tasks."""
@@ -66,7 +67,7 @@ class TestWebScrapingCommands(unittest.TestCase):
         self.assertIn("Starting all scraping tasks", output)
         self.assertIn("Scraping completed successfully", output)
 
-    @patch('src.cli.commands.Master')
+    @patch('src.scrapers.Master.Master')
     @patch('src.cli.commands.generate_tasks')
     def test_run_all_tasks_exception(self, mock_generate_tasks, mock_master_class):
         """Test handling of exceptions during task execution."""
@@ -79,11 +80,12 @@ class TestWebScrapingCommands(unittest.TestCase):
         self.assertIn("Error during scraping", output)
         self.assertIn("Test error", output)
 
-    @patch('src.cli.commands.Master')
+    @patch('src.scrapers.Master.Master')
     @patch('src.cli.commands.generate_tasks')
     def test_run_filtered_tasks_news(self, mock_generate_tasks, mock_master_class):
         """Test running filtered news tasks."""
-        mock_generate_tasks.return_value = SAMPLE_CONFIG["tasks"]
+        mock_generate_tasks.return_value = [(i, task) for i, task in enumerate(SAMPLE_CONFIG["tasks"])
+                                            if task["type"] == "news"]
         mock_master = MagicMock()
         mock_master_class.return_value = mock_master
         
@@ -95,23 +97,39 @@ class TestWebScrapingCommands(unittest.TestCase):
         self.assertIn("Starting news scraping", output)
         self.assertIn("News scraping completed", output)
 
-    @patch('src.cli.commands.Master')
+    @patch('src.scrapers.Master.Master')
+    @patch('src.utils.configs.json.load', return_value=SAMPLE_CONFIG)
+    @patch('src.utils.configs.open', new_callable=mock_open, create=True)
+    def test_run_filtered_tasks_keep_config_ids(self, mock_file, mock_json_load, mock_master_class):
+        """Test that filtered runs number tasks by their position in the full config."""
+        mock_master = MagicMock()
+        mock_master_class.return_value = mock_master
+        
+        with patch('sys.stdout', new=StringIO()):
+            self.commands.run_rss_only()
+            self.commands.run_news_only()
+        
+        # SAMPLE_CONFIG lists the blog, rss and news tasks in that order
+        run_ids = [[task.id for task in call.args[0]] for call in mock_master.run.call_args_list]
+        self.assertEqual(run_ids, [[1], [2]])
+
+    @patch('src.scrapers.Master.Master')
     @patch('src.cli.commands.generate_tasks')
     def test_run_filtered_tasks_no_tasks_found(self, mock_generate_tasks, mock_master_class):
         """Test running filtered tasks when no tasks of that type are found."""
-        # Create config with no RSS tasks
-        config_without_rss = SAMPLE_CONFIG.copy()
-        config_without_rss["tasks"] = [task for task in SAMPLE_CONFIG["tasks"] if task["type"] != "rss"]
-        mock_generate_tasks.return_value = config_without_rss["tasks"]
+        # generate_tasks filters by type; the config has no RSS tasks
+        mock_generate_tasks.return_value = []
         
         with patch('sys.stdout', new=StringIO()) as fake_output:
             self.commands.run_rss_only()
         
+        mock_generate_tasks.assert_called_once_with(task_type="rss")
+        mock_master_class.assert_not_called()
         output = fake_output.getvalue()
         self.assertIn("No rss tasks found", output)
 
     @patch('builtins.input', return_value='1,3')
-    @patch('src.cli.commands.Master')
+    @patch('src.scrapers.Master.Master')
     @patch('src.cli.commands.generate_tasks')
     def test_run_custom_selection_success(self, mock_generate_tasks, mock_master_class, mock_input):
         """Test successful custom task selection."""
@@ -138,8 +156,8 @@ class TestWebScrapingCommands(unittest.TestCase):
 
     @patch('builtins.input', side_effect=['1', 'blog', 'https://newblog.com', '5', '4'])
     @patch('builtins.open', new_callable=mock_open, read_data='{"tasks": []}')
-    @patch('json.load')
-    @patch('json.dump')
+    @patch('src.cli.commands.jsonio.loads')
+    @patch('src.cli.commands.jsonio.dumps', return_value=b'{}')
     def test_edit_tasks_add_task(self, mock_json_dump, mock_json_load, mock_file, mock_input):
         """Test adding a new task."""
         mock_json_load.return_value = SAMPLE_CONFIG
@@ -154,8 +172,8 @@ class TestWebScrapingCommands(unittest.TestCase):
 
     @patch('builtins.input', side_effect=['2', '1', 'https://updated.com', '', '4'])
     @patch('builtins.open', new_callable=mock_open)
-    @patch('json.load')
-    @patch('json.dump')
+    @patch('src.cli.commands.jsonio.loads')
+    @patch('src.cli.commands.jsonio.dumps', return_value=b'{}')
     def test_edit_tasks_edit_existing_task(self, mock_json_dump, mock_json_load, mock_file, mock_input):
         """Test editing an existing task."""
         mock_json_load.return_value = SAMPLE_CONFIG
@@ -169,8 +187,8 @@ class TestWebScrapingCommands(unittest.TestCase):
 
     @patch('builtins.input', side_effect=['3', '1', 'y', '4'])
     @patch('builtins.open', new_callable=mock_open)
-    @patch('json.load')
-    @patch('json.dump')
+    @patch('src.cli.commands.jsonio.loads')
+    @patch('src.cli.commands.jsonio.dumps', return_value=b'{}')
     def test_edit_tasks_delete_task(self, mock_json_dump, mock_json_load, mock_file, mock_input):
         """Test deleting a task."""
         mock_json_load.return_value = SAMPLE_CONFIG
@@ -216,6 +234,37 @@ class TestWebScrapingCommands(unittest.TestCase):
         self.assertIn("blog_data.json", output)
         self.assertIn("1 items", output)
 
+    @patch('src.cli.commands._count_file')
+    def test_data_overview_reuses_saved_counts(self, mock_count_file):
+        """Test that item counts saved by one run are reused by the next."""
+        blog_file = os.path.join(self.results_dir, "blog_data.json")
+        with open(blog_file, 'w') as f:
+            json.dump([{"title": "Test Article"}], f)
+        mock_count_file.return_value = 1
+
+        with patch('sys.stdout', new=StringIO()):
+            self.commands.data_overview()
+        # A fresh instance stands in for the next CLI run
+        with patch('sys.stdout', new=StringIO()) as fake_output:
+            WebScrapingCommands(self.config_file, self.results_dir).data_overview()
+
+        mock_count_file.assert_called_once_with(blog_file)
+        self.assertIn("blog_data.json: 1 items", fake_output.getvalue())
+
+    @patch('src.cli.commands._count_file')
+    def test_data_overview_uses_count_sidecar(self, mock_count_file):
+        """Test that a count recorded by the writer is used without parsing the file."""
+        blog_file = os.path.join(self.results_dir, "blog_data.json")
+        with open(blog_file, 'w') as f:
+            json.dump([{"title": "First"}, {"title": "Second"}], f)
+        jsonio.write_count(blog_file, 2)
+
+        with patch('sys.stdout', new=StringIO()) as fake_output:
+            self.commands.data_overview()
+
+        mock_count_file.assert_not_called()
+        self.assertIn("blog_data.json: 2 items", fake_output.getvalue())
+
     def test_system_status(self):
         """Test system status display."""
         with patch('sys.stdout', new=StringIO()) as fake_output:
@@ -297,6 +346,30 @@ class TestWebScrapingCommands(unittest.TestCase):
         self.assertIn("Proxy Settings", output)
         self.assertIn("Proxy added", output)
 
+    @patch('src.cli.commands.subprocess.run')
+    def test_run_all_tests_returns_exit_code(self, mock_run):
+        """Test that a failing test run reports and returns the child's exit code."""
+        mock_run.return_value = MagicMock(returncode=1)
+
+        with patch('sys.stdout', new=StringIO()) as fake_output:
+            returncode = self.commands.run_all_tests()
+
+        self.assertEqual(returncode, 1)
+        self.assertIn("Tests failed (exit code 1)", fake_output.getvalue())
+
+    def test_load_config_reuses_parsed_config(self):
+        """Test that the config is parsed once until the file changes."""
+        with patch('src.cli.commands.jsonio.loads', wraps=jsonio.loads) as mock_json_load:
+            first = self.commands._load_config()
+            second = self.commands._load_config()
+        self.assertIs(first, second)
+        self.assertEqual(mock_json_load.call_count, 1)
+
+        with patch('builtins.input', side_effect=['3', '7']):
+            with patch('sys.stdout', new=StringIO()):
+                self.commands.worker_settings()
+        self.assertEqual(self.commands._load_config()['max_workers'], 7)
+
     def test_rate_limiting_settings(self):
         """Test rate limiting settings display."""
         with patch('sys.stdout', new=StringIO()) as fake_output:
@@ -117,6 +117,18 @@ class TestConfigs(unittest.TestCase):
             os.chdir(original_cwd)
             os.unlink(temp_file_path)
 
+    @patch('builtins.open', new_callable=mock_open)
+    @patch('json.load')
+    def test_generate_tasks_filtered_by_type(self, mock_json_load, mock_file):
+        """Test task generation restricted to one task type."""
+        mock_json_load.return_value = self.sample_config
+        
+        tasks = generate_tasks(task_type="rss")
+        
+        expected = [(i, task) for i, task in enumerate(self.sample_config["tasks"]) if task["type"] == "rss"]
+        self.assertEqual(tasks, expected)
+        self.assertEqual(generate_tasks(task_type="unknown"), [])
+
     @patch('builtins.open', new_callable=mock_open)
     @patch('json.load')
     def test_generate_tasks_task_validation(self, mock_json_load, mock_file):